@@ -0,0 +1,146 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""#Module des images du jeu.
+
+Chaque image est décodée une seule fois par programme, puis la même
+`PhotoImage` est partagée par toutes les vues : changer d'écran ne lit
+plus le disque et ne décode plus de PNG.
+
+Fonctions:
+    - path: Chemin d'une image dans `Graphics`.
+    - names: Noms de toutes les images PNG du jeu.
+    - image: Image partagée, décodée au premier appel.
+    - preload: Précharge les images en arrière-plan.
+
+Notes:
+    - Tk ne peut être utilisé que depuis son propre fil d'exécution.
+      `preload` lit donc les fichiers sur un autre fil, mais décode les
+      images une à une dans la boucle de Tk.
+"""
+# Documentation
+from __future__ import annotations
+from typing import Iterable
+
+# Modules standards
+import base64
+import os
+import threading
+import tkinter as tk
+
+__docformat__ = "google"
+
+GRAPHICS = os.path.join(os.path.dirname(__file__), "Graphics")
+"""Dossier des images du jeu."""
+
+_images: dict[str, tk.PhotoImage] = {}
+_pending: dict[str, bytes] = {}  # Lues par `preload`, pas encore décodées
+_lock = threading.Lock()
+
+
+def path(name: str) -> str:
+    """##Retourne le chemin de l'image `name`, relatif à `GRAPHICS`.
+
+    Example:
+        path("Buttons/quitButton.png")
+    """
+    return os.path.join(GRAPHICS, *name.split("/"))
+
+
+def names() -> list[str]:
+    """##Retourne les noms de toutes les images PNG de `GRAPHICS`."""
+    found = []
+    for directory, _, files in os.walk(GRAPHICS):
+        relative = os.path.relpath(directory, GRAPHICS)
+        for file in sorted(files):
+            if file.endswith(".png"):
+                parts = () if relative == os.curdir else relative.split(os.sep)
+                found.append("/".join((*parts, file)))
+    return found
+
+
+def image(name: str) -> tk.PhotoImage:
+    """##Retourne l'image partagée `name`.
+
+    L'image est décodée au premier appel seulement, à partir des données
+    déjà lues par `preload` si elles sont prêtes.
+
+    Args:
+        - name: Nom de l'image, relatif à `GRAPHICS` (voir `path`).
+    """
+    photo = _images.get(name)
+    if photo is None:
+        with _lock:
+            data = _pending.pop(name, None)
+        if data is not None:
+            photo = tk.PhotoImage(data=data)
+        else:
+            photo = tk.PhotoImage(file=path(name))
+        _images[name] = photo
+    return photo
+
+
+def preload(
+        widget: tk.Misc, assets: Iterable[str] | None = None
+) -> threading.Thread:
+    """##Précharge des images sans bloquer la boucle de Tk.
+
+    Un fil d'exécution lit les fichiers, puis un rappel `after` décode
+    une image déjà lue à chaque passage.
+
+    Args:
+        - widget: Widget Tk utilisé pour planifier les rappels.
+        - assets: Noms des images. Par défaut, toutes celles de `names`.
+
+    Returns:
+        - Le fil d'exécution qui lit les fichiers.
+    """
+    todo = [name for name in (assets or names()) if name not in _images]
+
+    # Le fil lit sa propre copie : `decode` retire des noms de `todo`
+    # pendant la lecture.
+    to_read = tuple(todo)
+
+    def read() -> None:
+        for name in to_read:
+            try:
+                with open(path(name), 'rb') as file:
+                    data = base64.b64encode(file.read())
+            except OSError:
+                continue  # `image` signalera l'erreur si l'image sert
+            with _lock:
+                _pending[name] = data
+
+    def decode() -> None:
+        with _lock:
+            ready = [name for name in todo if name in _pending]
+        for name in ready[:1]:
+            todo.remove(name)
+            if name in _images:  # Déjà décodée par un appel à `image`
+                with _lock:
+                    del _pending[name]
+            else:
+                image(name)
+        if todo and (ready or reader.is_alive()):
+            widget.after(1 if ready else 10, decode)
+
+    reader = threading.Thread(target=read, name="assets", daemon=True)
+    reader.start()
+    widget.after(10, decode)
+    return reader
@@ -0,0 +1,112 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""#Module d'écriture en arrière-plan.
+
+Les fichiers de fin de partie (télémétrie, replays) sont écrits sur un
+fil d'exécution séparé : la boucle de Tk ne fait que déposer les
+éléments dans une file.
+
+Classe:
+    - BackgroundWriter: Base des écrivains en arrière-plan.
+
+Fonction:
+    - shared: Décorateur d'un écrivain partagé par tout le programme.
+"""
+# Documentation
+from __future__ import annotations
+from typing import Any, Callable, TypeVar
+
+# Modules standards
+from functools import cache, wraps
+import atexit
+import queue
+import threading
+
+__docformat__ = "google"
+
+W = TypeVar("W", bound="BackgroundWriter")
+
+
+class BackgroundWriter:
+    """#Écrit des éléments sur un fil d'exécution séparé.
+
+    Les éléments sont mis dans une file. Un fil d'exécution, démarré au
+    premier élément, les passe par lots à `write`, que les sous-classes
+    redéfinissent.
+
+    Attributs:
+        - name: Nom du fil d'exécution.
+        """
+    _STOP = None
+
+    def __init__(self, name: str = "writer"):
+        """"""
+        self.name = name
+        self._queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+
+    def put(self, item: Any) -> None:
+        """##Ajoute un élément à la file d'écriture.
+
+        Ne bloque jamais : l'écriture se fait sur le fil d'exécution.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name=self.name, daemon=True
+            )
+            self._thread.start()
+        self._queue.put(item)
+
+    def close(self) -> None:
+        """##Écrit les éléments restants et arrête le fil."""
+        if self._thread is not None:
+            self._queue.put(self._STOP)
+            self._thread.join()
+            self._thread = None
+
+    def write(self, batch: list[Any]) -> None:
+        """##Écrit un lot d'éléments. Appelée sur le fil d'exécution."""
+        raise NotImplementedError
+
+    def _run(self) -> None:
+        """##Écrit les éléments jusqu'à l'arrêt."""
+        while True:
+            batch = [self._queue.get()]
+            # Tout ce qui attend déjà est écrit dans le même lot
+            while not self._queue.empty():
+                batch.append(self._queue.get())
+            stop = self._STOP in batch
+            items = [item for item in batch if item is not self._STOP]
+            if items:
+                self.write(items)
+            if stop:
+                return
+
+
+def shared(factory: Callable[[], W]) -> Callable[[], W]:
+    """##Décore une fonction qui crée un écrivain : il n'est créé qu'au
+    premier appel, puis fermé à la sortie du programme."""
+    @cache
+    @wraps(factory)
+    def get() -> W:
+        writer = factory()
+        atexit.register(writer.close)
+        return writer
+    return get
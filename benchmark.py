@@ -0,0 +1,669 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""#Bancs d'essai du jeu.
+
+Chaque banc d'essai est une fonction `bench_*` qui retourne ses mesures
+dans un dictionnaire. Le module peut aussi être lancé directement :
+
+    python benchmark.py bounds --ticks 10000
+    python benchmark.py allocations --ticks 10000
+    python benchmark.py render --counts 10 100 1000
+    python benchmark.py startup --runs 5
+    python benchmark.py config --sections 100 --keys 50
+    python benchmark.py scaling --output scaling.json
+    python benchmark.py scaling --compare old.json --output new.json
+
+Notes:
+    - Les bancs d'essai qui utilisent Tk ont besoin d'un affichage.
+"""
+# Documentation
+from __future__ import annotations
+from typing import Callable
+
+# Modules standards
+from time import perf_counter
+import argparse
+import copy
+import json
+import platform
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tkinter as tk
+import tracemalloc
+
+# Modules de projet
+from config import Config, deep_compare, deep_get, deep_set, deep_update
+from settings import Settings
+from geometry import Vec2
+from model import SpriteBatch
+from world import World, EnemyStore, np
+
+__docformat__ = "google"
+
+
+def _time_per_tick(tick: Callable[[], object], ticks: int) -> float:
+    """##Retourne la durée moyenne d'un tick, en microsecondes."""
+    start = perf_counter()
+    for _ in range(ticks):
+        tick()
+    return (perf_counter() - start) / ticks * 1e6
+
+
+def _canvas(width: int, height: int) -> tk.Canvas:
+    """##Crée un canvas affiché de la taille demandée."""
+    root = tk.Tk()
+    canvas = tk.Canvas(root, width=width, height=height)
+    canvas.pack()
+    root.update()
+    return canvas
+
+
+def bench_bounds(ticks: int = 10_000) -> dict[str, float]:
+    """##Compare un tick qui interroge la taille du canvas à un tick qui
+    utilise les limites gardées par la simulation.
+
+    Args:
+        - ticks: Nombre de ticks mesurés pour chaque variante.
+
+    Returns:
+        - La durée moyenne d'un tick (µs) avant et après.
+    """
+    size = Config.get_instance()["Game"]["Size"]
+    canvas = _canvas(size["Width"], size["Height"])
+    world = World.from_config(
+        Config.get_instance(), canvas.winfo_width(), canvas.winfo_height()
+    )
+    items = [canvas.create_rectangle(*body.box) for body in world.enemies]
+
+    def redraw():
+        for item, body in zip(items, world.enemies):
+            canvas.coords(item, *body.box)
+
+    def tick_before():
+        world.resize(canvas.winfo_width(), canvas.winfo_height())
+        world.step()
+        redraw()
+
+    def tick_after():
+        world.step()
+        redraw()
+
+    results = {
+        "before_us": _time_per_tick(tick_before, ticks),
+        "after_us": _time_per_tick(tick_after, ticks),
+    }
+    canvas.winfo_toplevel().destroy()
+    return results
+
+
+def bench_allocations(
+        ticks: int = 10_000, vectorized: bool = True
+) -> dict[str, float]:
+    """##Mesure avec `tracemalloc` la mémoire allouée par le chemin d'un
+    tick sans affichage : simulation et coordonnées des sprites.
+
+    Args:
+        - ticks: Nombre de ticks simulés.
+        - vectorized: Utiliser NumPy s'il est disponible.
+
+    Returns:
+        - Les octets alloués par tick (moyenne et maximum), mesurés par
+          le pic de mémoire de chaque tick, et les blocs encore alloués
+          à la fin, qui indiqueraient une fuite.
+    """
+    config = Config.get_instance()
+    size = config["Game"]["Size"]
+    world = World.from_config(
+        config, size["Width"], size["Height"],
+        None if vectorized else EnemyStore(),
+    )
+    # Ce que `model.RectSprite.redraw` calcule pour chaque sprite
+    sprites = [(body, Vec2(), Vec2()) for body in world.enemies]
+
+    def tick():
+        world.step()
+        for body, p1, p2 in sprites:
+            body.corners(p1, p2)
+
+    tick()  # Réchauffe les caches avant de mesurer
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    total = largest = 0
+    for _ in range(ticks):
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        tick()
+        allocated = tracemalloc.get_traced_memory()[1] - current
+        total += allocated
+        largest = max(largest, allocated)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    retained = sum(
+        stat.count_diff for stat in after.compare_to(before, "filename")
+        if stat.traceback[0].filename != tracemalloc.__file__
+    )
+    return {
+        "ticks": ticks,
+        "bytes_per_tick": total / ticks,
+        "max_bytes_per_tick": largest,
+        "retained_blocks": retained,
+    }
+
+
+def synthetic_enemies(
+        count: int, width: float, height: float, seed: int = 0
+) -> list[dict]:
+    """##Génère une disposition d'ennemis au format de `config["Enemies"]`.
+
+    Args:
+        - count: Nombre d'ennemis.
+        - width: Largeur de l'arène.
+        - height: Hauteur de l'arène.
+        - seed: Graine du générateur, pour des dispositions reproductibles.
+    """
+    rng = random.Random(seed)
+    enemies = []
+    for _ in range(count):
+        w, h = rng.randint(10, 60), rng.randint(10, 60)
+        enemies.append({
+            "Size": {"Width": w, "Height": h},
+            "Position": {
+                "X": rng.uniform(w, width - w),
+                "Y": rng.uniform(h, height - h),
+            },
+            "Speed": {
+                "X": rng.choice((-1, 1)) * rng.randint(1, 5),
+                "Y": rng.choice((-1, 1)) * rng.randint(1, 5),
+            },
+        })
+    return enemies
+
+
+def _run_ticks(tick: Callable[[], object], ticks: int) -> dict[str, float]:
+    """##Exécute des ticks et résume leur latence."""
+    latencies = []
+    for _ in range(ticks):
+        start = perf_counter()
+        tick()
+        latencies.append(perf_counter() - start)
+    percentiles = statistics.quantiles(latencies, n=100)
+    return {
+        "ticks_per_second": ticks / sum(latencies),
+        "p50_ms": percentiles[49] * 1e3,
+        "p99_ms": percentiles[98] * 1e3,
+    }
+
+
+def bench_scaling(
+        counts: tuple[int, ...] = (1, 10, 100, 1000, 10_000),
+        ticks: int = 500,
+        vectorized: bool = True,
+        use_tk: bool = True,
+) -> dict:
+    """##Mesure comment un tick évolue avec le nombre d'ennemis.
+
+    Pour chaque taille, une disposition synthétique est simulée sans
+    affichage, puis contre un vrai `tk.Canvas` si un affichage est
+    disponible. La mémoire maximale est mesurée avec `tracemalloc` dans
+    une passe séparée, afin de ne pas fausser les temps.
+
+    Args:
+        - counts: Nombres d'ennemis à mesurer.
+        - ticks: Nombre de ticks par mesure.
+        - vectorized: Utiliser NumPy s'il est disponible.
+        - use_tk: Mesurer aussi contre un canvas Tk.
+
+    Returns:
+        - Les résultats et la description de la machine, prêts à être
+          écrits en JSON.
+    """
+    config = Config.get_instance()
+    size = config["Game"]["Size"]
+    width, height = size["Width"], size["Height"]
+    canvas = None
+    if use_tk:
+        try:
+            canvas = _canvas(width, height)
+        except tk.TclError:
+            pass  # Aucun affichage : mesures sans Tk seulement
+
+    def build(count: int) -> World:
+        settings = copy.deepcopy(config.config)
+        settings["Enemies"] = synthetic_enemies(count, width, height)
+        return World.from_config(
+            settings, width, height, None if vectorized else EnemyStore()
+        )
+
+    results = []
+    for count in counts:
+        world = build(count)
+        entry = {"enemies": count, "headless": _run_ticks(world.step, ticks)}
+
+        tracemalloc.start()
+        world = build(count)
+        for _ in range(ticks):
+            world.step()
+        entry["headless"]["peak_memory_kb"] = (
+            tracemalloc.get_traced_memory()[1] / 1024
+        )
+        tracemalloc.stop()
+
+        if canvas is not None:
+            world = build(count)
+            batch = SpriteBatch(canvas, world.enemies, [
+                canvas.create_rectangle(*body.box) for body in world.enemies
+            ])
+
+            def tick():
+                world.step()
+                batch.redraw()
+                canvas.update_idletasks()
+
+            entry["tk"] = _run_ticks(tick, ticks)
+            canvas.delete("all")
+        results.append(entry)
+
+    if canvas is not None:
+        canvas.winfo_toplevel().destroy()
+    return {
+        "host": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__ if np is not None and vectorized else None,
+            "tk": canvas is not None,
+        },
+        "ticks": ticks,
+        "results": results,
+    }
+
+
+def compare_scaling(old: dict, new: dict) -> list[str]:
+    """##Compare deux résultats de `bench_scaling`.
+
+    Returns:
+        - Une ligne par taille et par mode, avec le rapport des ticks
+          par seconde (nouveau / ancien).
+    """
+    lines = []
+    previous = {entry["enemies"]: entry for entry in old["results"]}
+    for entry in new["results"]:
+        before = previous.get(entry["enemies"])
+        if before is None:
+            continue
+        for mode in ("headless", "tk"):
+            if mode in entry and mode in before:
+                ratio = (entry[mode]["ticks_per_second"]
+                         / before[mode]["ticks_per_second"])
+                lines.append(f"{entry['enemies']:>6} {mode:<8} x{ratio:.2f}")
+    return lines
+
+
+def bench_render(
+        counts: tuple[int, ...] = (10, 100, 1000), ticks: int = 1000
+) -> dict[str, float]:
+    """##Compare le rendu d'une image sprite par sprite au rendu groupé
+    de `model.SpriteBatch`.
+
+    Seul le rendu est chronométré : la simulation avance entre deux
+    mesures pour que les coordonnées changent réellement.
+
+    Args:
+        - counts: Nombres d'ennemis à mesurer.
+        - ticks: Nombre d'images rendues pour chaque variante.
+
+    Returns:
+        - La durée moyenne du rendu d'une image (µs) pour chaque nombre
+          d'ennemis et chaque variante.
+    """
+    config = Config.get_instance()
+    size = config["Game"]["Size"]
+    width, height = size["Width"], size["Height"]
+    canvas = _canvas(width, height)
+
+    def measure(render: Callable[[], object], world: World) -> float:
+        total = 0.0
+        for _ in range(ticks):
+            world.step()
+            start = perf_counter()
+            render()
+            total += perf_counter() - start
+        canvas.update_idletasks()
+        return total / ticks * 1e6
+
+    results = {}
+    for count in counts:
+        settings = copy.deepcopy(config.config)
+        settings["Enemies"] = synthetic_enemies(count, width, height)
+        world = World.from_config(settings, width, height)
+        items = [canvas.create_rectangle(*body.box) for body in world.enemies]
+
+        def per_sprite():
+            for item, body in zip(items, world.enemies):
+                canvas.coords(item, *body.box)
+
+        results[f"{count}_per_sprite_us"] = measure(per_sprite, world)
+        batch = SpriteBatch(canvas, world.enemies, items)
+        results[f"{count}_batched_us"] = measure(batch.redraw, world)
+        canvas.delete("all")
+
+    canvas.winfo_toplevel().destroy()
+    return results
+
+
+def _legacy_deep_update(dct: dict, new: dict) -> None:
+    """##`config.deep_update` avant l'index : file `list.pop(0)` et
+    `deep_set` depuis la racine pour chaque valeur."""
+    stack: list[tuple[tuple, dict]] = [((), new)]
+    while stack:
+        keystack, subdict = stack.pop(0)
+        for key, val in subdict.items():
+            keys = (*keystack, key)
+            if isinstance(val, dict):
+                stack.append((keys, val))
+            else:
+                deep_set(dct, keys, val)
+
+
+def _legacy_deep_compare(dct: dict, defaults: dict) -> dict:
+    """##`config.deep_compare` avant l'index : file `list.pop(0)` et
+    `deep_get` depuis la racine pour chaque valeur."""
+    stack: list[tuple[tuple, dict]] = [((), dct)]
+    diffs: dict = {}
+    while stack:
+        keystack, subdict = stack.pop(0)
+        for key, val in subdict.items():
+            keys = (*keystack, key)
+            if isinstance(val, dict):
+                stack.append((keys, val))
+            elif val != deep_get(defaults, keys):
+                deep_set(diffs, keys, val)
+    return diffs
+
+
+def bench_config(
+        sections: int = 100, keys: int = 50, enemies: int = 1000,
+        repeat: int = 20,
+) -> dict[str, float]:
+    """##Mesure la fusion, la comparaison et la lecture d'une grande
+    configuration, sa lecture au démarrage, et la création d'une partie
+    à partir de celle-ci.
+
+    La configuration synthétique a `sections` sections de `keys`
+    sous-sections à deux valeurs, en plus des valeurs par défaut et
+    d'une liste de `enemies` ennemis.
+
+    Args:
+        - sections: Nombre de sections ajoutées.
+        - keys: Nombre de sous-sections par section.
+        - enemies: Nombre d'ennemis de la liste `Enemies`.
+        - repeat: Nombre de répétitions de chaque mesure.
+
+    Returns:
+        - Les durées moyennes (µs) avant et après l'index, et le nombre
+          de chemins de la configuration.
+    """
+    config = Config.get_instance()
+    original = config.config
+    defaults = copy.deepcopy(original)
+    defaults["Enemies"] = synthetic_enemies(enemies, 450, 450)
+    for section in range(sections):
+        defaults[f"Section{section}"] = {
+            f"Key{key}": {"Value": key, "Name": f"{section}.{key}"}
+            for key in range(keys)
+        }
+    # Une valeur sur dix diffère des défauts
+    changes = {
+        f"Section{section}": {
+            f"Key{key}": {"Value": -key} for key in range(0, keys, 10)
+        }
+        for section in range(sections)
+    }
+    merged = copy.deepcopy(defaults)
+    deep_update(merged, changes)
+
+    def timed(function: Callable[[], object]) -> float:
+        start = perf_counter()
+        for _ in range(repeat):
+            function()
+        return (perf_counter() - start) / repeat * 1e6
+
+    # Appliquer deux fois les mêmes changements ne modifie plus rien :
+    # la même copie sert à toutes les répétitions.
+    target = copy.deepcopy(defaults)
+    results = {
+        "update_before_us": timed(
+            lambda: _legacy_deep_update(target, changes)
+        ),
+        "update_after_us": timed(lambda: deep_update(target, changes)),
+        "compare_before_us": timed(
+            lambda: _legacy_deep_compare(merged, defaults)
+        ),
+        "compare_after_us": timed(lambda: deep_compare(merged, defaults)),
+        # Création d'une partie : dictionnaires imbriqués ou paramètres
+        # figés une fois au début de la partie
+        "spawn_config_us": timed(
+            lambda: World.from_config(merged, 450, 450)
+        ),
+        "snapshot_us": timed(lambda: Settings.from_config(merged)),
+    }
+    # Lecture au démarrage : JSON fusionné ou cache à jour
+    config._load()
+    results["load_json_us"] = timed(config._parse)
+    results["load_cache_us"] = timed(config._load)
+    settings = Settings.from_config(merged)
+    results["spawn_settings_us"] = timed(
+        lambda: World.from_settings(settings, 450, 450)
+    )
+
+    try:
+        config.config = merged
+        config.reindex()
+        results["paths"] = len(config.paths())
+        results["reindex_us"] = timed(config.reindex)
+        path = f"Section{sections - 1}.Key{keys - 1}.Value"
+        keys_ = path.split(".")
+        lookups = 1000
+        accessor = config.accessor(path)
+
+        def chained():
+            for _ in range(lookups):
+                config[keys_[0]][keys_[1]][keys_[2]]
+
+        def dotted():
+            for _ in range(lookups):
+                config.get(path)
+
+        def compiled():
+            for _ in range(lookups):
+                accessor()
+
+        results["lookup_chained_ns"] = timed(chained) * 1e3 / lookups
+        results["lookup_get_ns"] = timed(dotted) * 1e3 / lookups
+        results["lookup_accessor_ns"] = timed(compiled) * 1e3 / lookups
+    finally:
+        config.config = original
+        config.reindex()
+    return results
+
+
+_FIRST_FRAME = """
+import runpy, time
+start = time.perf_counter()
+root = runpy.run_path("game_engine.pyw")["Root"]()
+root.menu.start()
+root.update()
+print(time.perf_counter() - start, flush=True)
+root.destroy()
+"""
+
+
+def bench_startup(runs: int = 5, top: int = 10) -> dict:
+    """##Mesure le démarrage à froid du jeu, dans de nouveaux processus.
+
+    Le temps d'importation est celui de `controller`, tel que rapporté
+    par `python -X importtime`. Le temps avant la première image est
+    mesuré de l'extérieur, du lancement de l'interpréteur jusqu'à
+    l'affichage du menu ; il demande un affichage.
+
+    Args:
+        - runs: Nombre de lancements ; la médiane est retenue.
+        - top: Nombre de modules les plus lents à détailler.
+
+    Returns:
+        - Les médianes en millisecondes (`None` pour la première image
+          sans affichage) et les modules les plus lents du dernier
+          lancement, par temps cumulé.
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    imports, frames = [], []
+    modules: list[tuple[str, float]] = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import controller"],
+            cwd=directory, capture_output=True, text=True, check=True,
+        ).stderr
+        modules = []
+        for line in output.splitlines():
+            # import time: self [us] | cumulative | imported package
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line.split("|")
+            modules.append((name.strip(), int(cumulative) / 1e3))
+        imports.append(dict(modules)["controller"])
+
+        start = perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "-c", _FIRST_FRAME], cwd=directory,
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+        )
+        shown = process.stdout.readline()
+        elapsed = perf_counter() - start
+        process.wait()
+        if shown:
+            frames.append(elapsed * 1e3)
+
+    modules.sort(key=lambda module: module[1], reverse=True)
+    return {
+        "import_ms": statistics.median(imports),
+        "first_frame_ms": statistics.median(frames) if frames else None,
+        "slowest_imports": modules[:top],
+    }
+
+
+def main(args: list[str] | None = None) -> None:
+    """##Lance un banc d'essai depuis la ligne de commande."""
+    parser = argparse.ArgumentParser(description="Bancs d'essai du jeu.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    bounds = commands.add_parser(
+        "bounds", help="tick avec et sans requêtes winfo_*"
+    )
+    bounds.add_argument("--ticks", type=int, default=10_000)
+
+    allocations = commands.add_parser(
+        "allocations", help="mémoire allouée par tick (tracemalloc)"
+    )
+    allocations.add_argument("--ticks", type=int, default=10_000)
+    allocations.add_argument(
+        "--no-numpy", dest="vectorized", action="store_false"
+    )
+
+    startup = commands.add_parser(
+        "startup", help="démarrage à froid : importations et première image"
+    )
+    startup.add_argument("--runs", type=int, default=5)
+    startup.add_argument("--top", type=int, default=10)
+
+    configuration = commands.add_parser(
+        "config", help="fusion, comparaison et lecture de la configuration"
+    )
+    configuration.add_argument("--sections", type=int, default=100)
+    configuration.add_argument("--keys", type=int, default=50)
+    configuration.add_argument("--enemies", type=int, default=1000)
+    configuration.add_argument("--repeat", type=int, default=20)
+
+    render = commands.add_parser(
+        "render", help="rendu sprite par sprite ou groupé (SpriteBatch)"
+    )
+    render.add_argument("--counts", type=int, nargs="+", default=[10, 100, 1000])
+    render.add_argument("--ticks", type=int, default=1000)
+
+    scaling = commands.add_parser(
+        "scaling", help="tick de 1 à 10 000 ennemis, avec et sans Tk"
+    )
+    scaling.add_argument(
+        "--counts", type=int, nargs="+", default=[1, 10, 100, 1000, 10_000]
+    )
+    scaling.add_argument("--ticks", type=int, default=500)
+    scaling.add_argument("--no-numpy", dest="vectorized", action="store_false")
+    scaling.add_argument("--no-tk", dest="use_tk", action="store_false")
+    scaling.add_argument("--output", help="fichier JSON des résultats")
+    scaling.add_argument("--compare", help="résultats JSON précédents")
+
+    options = parser.parse_args(args)
+    if options.command == "scaling":
+        report = bench_scaling(
+            tuple(options.counts), options.ticks,
+            options.vectorized, options.use_tk,
+        )
+        for entry in report["results"]:
+            for mode in ("headless", "tk"):
+                if mode in entry:
+                    stats = entry[mode]
+                    print(
+                        f"{entry['enemies']:>6} {mode:<8}"
+                        f" {stats['ticks_per_second']:>10.1f} ticks/s"
+                        f" p50 {stats['p50_ms']:.3f} ms"
+                        f" p99 {stats['p99_ms']:.3f} ms"
+                    )
+        if options.compare:
+            with open(options.compare) as file:
+                print("\n".join(compare_scaling(json.load(file), report)))
+        if options.output:
+            with open(options.output, 'w') as file:
+                json.dump(report, file, indent=4)
+        return
+
+    if options.command == "startup":
+        report = bench_startup(options.runs, options.top)
+        for name, cumulative in report.pop("slowest_imports"):
+            print(f"{cumulative:10.2f} ms  {name}")
+        results = report
+    elif options.command == "config":
+        results = bench_config(
+            options.sections, options.keys, options.enemies, options.repeat
+        )
+    elif options.command == "bounds":
+        results = bench_bounds(options.ticks)
+    elif options.command == "render":
+        results = bench_render(tuple(options.counts), options.ticks)
+    else:
+        results = bench_allocations(options.ticks, options.vectorized)
+    for name, value in results.items():
+        print(f"{name}: {value:.2f}" if isinstance(value, float)
+              else f"{name}: {value}")
+
+
+if __name__ == "__main__":
+    main()
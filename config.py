@@ -10,22 +10,38 @@ est optimisé pour n'inclure que les valeurs qui diffèrent de celles par
 défaut. Plusieurs méthodes permettant de manipuler des dictionnaires
 imbriqués sont aussi présentes.
 
+La configuration fusionnée est aussi gardée dans un cache binaire
+(`marshal`) à côté des fichiers JSON. Tant que les fichiers sources
+n'ont pas changé, le démarrage lit ce cache au lieu de lire et de
+fusionner le JSON.
+
 Example:
 
   config = Config.get_instance()
   config["Game"]["Difficulty"] = "HARD"
+  config.set("Game.Difficulty.Level", "HARD")
+  width = config.get("Game.Size.Width")
   config.save(indent=4)
+  config.save_later(indent=4)  # Sans bloquer, ex. dans un rappel Tk
+  config.watch(root, print)  # Affiche les valeurs modifiées à la main
 """
 
 from __future__ import annotations
-from typing import Sequence, Self, TextIO, Any
+from typing import Callable, Iterator, Sequence, Self, TextIO, Any
 
-from functools import reduce
+from collections import deque
+from functools import partial, reduce
+import atexit
 import json
+import marshal
 import os
+import threading
 
 __docformat__ = "google"
 
+CACHE_FORMAT = 1
+"""Version du format du cache. À changer si son contenu change."""
+
 
 class Multiton(type):
     """Permet d'initialiser l'objet une seule fois par nom.
@@ -56,28 +72,107 @@ class Config(metaclass=Multiton):
     complète des valeurs par défaut et des modifications. Pour accéder
     aux valeurs, l'utilisation de crochets `[]` est la méthode préférée.
 
+    Un index associe aussi chaque chemin pointé (`"Game.Size.Width"`) au
+    dictionnaire qui contient la valeur. `Config.get` et `Config.set`
+    accèdent donc à une valeur en O(1), peu importe sa profondeur, et
+    `Config.accessor` retourne une fonction qui lit toujours la même
+    valeur.
+
     Note:
         Pour obtenir un objet Config, la méthode `Config.get_instance`
         doit être utilisée à la place de la méthode d'initialisation.
+
+        Remplacer un dictionnaire entier avec les crochets rend l'index
+        invalide : utiliser `Config.set`, ou appeler `Config.reindex`.
+
+        Seules les modifications faites avec `Config.set` sont suivies
+        par `Config.save_later`. Après une modification avec les
+        crochets, appeler `Config.mark_dirty` ou `Config.save`.
     """
     def __init__(self, name):
         """Méthode interne. Voir `Config.get_instance`."""
         currentdir = os.path.dirname(__file__)
         configdir = os.path.join(currentdir, "Data")
         self.filepath = os.path.join(configdir, name + '.json')
-
-        # Charge les valeurs par défaut d'abord
-        self.config: dict[str, Any] = {}
+        self.cachepath = os.path.join(configdir, name + '.cache')
+        # Fichiers dont dépend la configuration fusionnée
+        self._sources = [self.filepath]
         if name != "defaults":
-            defaults = Config.get_instance("defaults").filepath
-            with open(defaults) as file:
-                self.config = json.load(file)
+            self._sources.insert(0, os.path.join(configdir, "defaults.json"))
+
+        self.config: dict[str, Any] = self._load()
+        self.reindex()
+
+        # Sauvegarde incrémentale (voir `save_later`)
+        self._dirty: set[str] = set()
+        self._diffs: dict[str, Any] | None = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._pending: tuple[int, str] | None = None
+        self._version = self._saved_version = 0
+        atexit.register(self.flush)
+        # Dernière version connue du fichier (voir `reload`)
+        self._stat = self._file_stat()
+
+    def _load(self) -> dict[str, Any]:
+        """Retourne la configuration fusionnée, depuis le cache s'il est
+        à jour. Sinon, le JSON est lu et le cache est reconstruit."""
+        key = self._cache_key()
+        if key is not None:
+            try:
+                with open(self.cachepath, 'rb') as file:
+                    cached_key, config = marshal.loads(file.read())
+                if cached_key == key:
+                    return config
+            except (OSError, EOFError, ValueError, TypeError):
+                pass  # Cache absent ou illisible
+
+        config = self._parse()
+        key = self._cache_key()  # `_parse` peut avoir créé le fichier
+        if key is not None:
+            try:
+                _write_atomic(self.cachepath, marshal.dumps((key, config)))
+            except OSError:
+                pass  # Le cache n'est qu'une optimisation
+        return config
+
+    def _parse(self) -> dict[str, Any]:
+        """Lit et fusionne les fichiers JSON, sans le cache."""
+        # Charge les valeurs par défaut d'abord
+        config: dict[str, Any] = {}
+        *defaults, own = self._sources
+        if defaults:
+            with open(defaults[0]) as file:
+                config = json.load(file)
         try:
-            with open(self.filepath) as file:
-                deep_update(self.config, json.load(file))
+            with open(own) as file:
+                deep_update(config, json.load(file))
         except (OSError, json.JSONDecodeError):
-            with open(self.filepath, 'a') as file:
+            with open(own, 'a') as file:
                 file.write('{}')
+        return config
+
+    def _file_stat(self) -> tuple[int, int] | None:
+        """Retourne la date de modification et la taille du fichier, ou
+        None s'il est inaccessible."""
+        try:
+            stat = os.stat(self.filepath)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _cache_key(self) -> tuple | None:
+        """Retourne la date de modification et la taille de chaque
+        fichier source, ou None si un fichier est inaccessible."""
+        try:
+            stats = [os.stat(source) for source in self._sources]
+        except OSError:
+            return None
+        return (
+            CACHE_FORMAT,
+            *((stat.st_mtime_ns, stat.st_size) for stat in stats),
+        )
 
     @classmethod
     def get_instance(cls, name: str = "settings") -> Self:
@@ -98,6 +193,87 @@ class Config(metaclass=Multiton):
         """Accès directe au dictionnaire des configurations."""
         return self.config[__key]
 
+    def reindex(self) -> None:
+        """Reconstruit l'index des chemins pointés à partir de la
+        configuration en mémoire. Linéaire en nombre de clés."""
+        self._paths: dict[str, tuple[dict[str, Any], str]] = {}
+        stack: list[tuple[str, dict[str, Any]]] = [("", self.config)]
+        while stack:
+            prefix, subdict = stack.pop()
+            for key, val in subdict.items():
+                path = prefix + key
+                self._paths[path] = (subdict, key)
+                if isinstance(val, dict):
+                    stack.append((path + ".", val))
+
+    def paths(self) -> list[str]:
+        """Retourne tous les chemins pointés de la configuration."""
+        return list(self._paths)
+
+    def get(self, path: str, default: Any = None) -> Any:
+        """Retourne la valeur à un chemin pointé, en O(1).
+
+        Args:
+            path: Chemin des clés séparées par des points, par exemple
+              `"Game.Size.Width"`.
+            default: Valeur retournée si le chemin n'existe pas.
+        """
+        entry = self._paths.get(path)
+        if entry is None:
+            return default
+        parent, key = entry
+        return parent[key]
+
+    def set(self, path: str, value: Any) -> None:
+        """Modifie la valeur à un chemin pointé.
+
+        Remplacer une valeur simple existante est en O(1). Créer un
+        chemin, ou mettre ou remplacer un dictionnaire, reconstruit
+        l'index.
+
+        Args:
+            path: Chemin des clés séparées par des points.
+            value: La nouvelle valeur.
+        """
+        self._dirty.add(path)
+        self._assign(path, value)
+
+    def _assign(self, path: str, value: Any) -> None:
+        """Modifie la valeur à un chemin pointé, sans la marquer comme
+        modifiée. Voir `Config.set`."""
+        entry = self._paths.get(path)
+        if entry is not None and not isinstance(value, dict):
+            parent, key = entry
+            if not isinstance(parent[key], dict):
+                parent[key] = value
+                return
+        deep_set(self.config, path.split("."), value)
+        self.reindex()
+
+    def mark_dirty(self, path: str) -> None:
+        """Signale une valeur modifiée sans `Config.set`, afin que
+        `Config.save_later` la sauvegarde.
+
+        Args:
+            path: Chemin pointé de la valeur, ou d'un dictionnaire
+              parent.
+        """
+        self._dirty.add(path)
+
+    def accessor(self, path: str) -> Callable[[], Any]:
+        """Retourne une fonction sans argument qui lit la valeur à un
+        chemin pointé, sans chercher le chemin à chaque appel.
+
+        La fonction suit les modifications faites avec `Config.set` ou
+        `deep_update`, mais pas le remplacement d'un dictionnaire
+        parent.
+
+        Raises:
+            KeyError: Si le chemin n'existe pas.
+        """
+        parent, key = self._paths[path]
+        return partial(parent.__getitem__, key)
+
     def save(self, file: TextIO | str | None = None, **kwargs) -> None:
         """Sauvegarde la configuration optimisée pour la taille dans un
         fichier.
@@ -107,15 +283,220 @@ class Config(metaclass=Multiton):
               file-like ou un chemin. Si la valeur n'est pas donnée, le
               fichier utilisé lors de l'initialisation est pris.
             **kwargs: Arguments passés à `json.dump`.
+
+        Note:
+            Toute la configuration est comparée aux valeurs par défaut,
+            et le fichier est écrit avant le retour de la méthode. Un
+            chemin est remplacé d'un coup, sans jamais laisser un
+            fichier à moitié écrit.
         """
         defaults = Config.get_instance('defaults').config
         diffs = deep_compare(self.config, defaults)
         file = file if file is not None else self.filepath
         if not isinstance(file, str):
             json.dump(diffs, file, **kwargs)
-        else:
-            with open(file, 'w') as out:
-                json.dump(diffs, out, **kwargs)
+            return
+        if file != self.filepath:
+            _write_atomic(file, json.dumps(diffs, **kwargs))
+            return
+
+        # Remplace une sauvegarde en attente, devenue périmée
+        self._dirty.clear()
+        self._diffs = diffs
+        with self._lock:
+            self._cancel_timer()
+            self._pending = None
+            self._version += 1
+            version = self._version
+        self._write(version, json.dumps(diffs, **kwargs))
+
+    def save_later(self, delay: float = 0.5, **kwargs) -> None:
+        """Sauvegarde la configuration dans son fichier, sans bloquer.
+
+        Seuls les chemins modifiés depuis la dernière sauvegarde sont
+        comparés aux valeurs par défaut, et seules leurs entrées sont
+        mises à jour dans les différences gardées en mémoire. Le
+        fichier est écrit par un autre fil d'exécution, `delay`
+        secondes après le dernier appel : plusieurs appels rapprochés
+        ne produisent qu'une écriture.
+
+        Args:
+            delay: Délai avant l'écriture, en secondes.
+            **kwargs: Arguments passés à `json.dumps`.
+
+        Note:
+            Une sauvegarde en attente est faite à la fermeture du
+            programme (voir `Config.flush`).
+        """
+        text = json.dumps(self._update_diffs(), **kwargs)
+        with self._lock:
+            self._version += 1
+            self._pending = (self._version, text)
+            self._cancel_timer()
+            self._timer = threading.Timer(delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Écrit tout de suite la sauvegarde en attente, s'il y en a
+        une."""
+        with self._lock:
+            self._cancel_timer()
+            pending, self._pending = self._pending, None
+        if pending is not None:
+            self._write(*pending)
+
+    def _cancel_timer(self) -> None:
+        """Annule l'écriture planifiée. Appelée avec `_lock`."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _write(self, version: int, text: str) -> None:
+        """Écrit `text` dans le fichier, sauf si une version plus
+        récente l'a déjà été."""
+        with self._write_lock:
+            if version > self._saved_version:
+                _write_atomic(self.filepath, text)
+                self._saved_version = version
+                # Une sauvegarde n'est pas une modification externe
+                self._stat = self._file_stat()
+
+    def reload(
+            self, validate: Callable[[dict[str, Any]], None] | None = None,
+    ) -> dict[str, Any]:
+        """Relit le fichier s'il a été modifié par un autre programme,
+        par exemple un éditeur de texte, et applique les valeurs qui ont
+        changé.
+
+        Le fichier ne contient que les différences avec les valeurs par
+        défaut. Il est comparé aux différences gardées en mémoire : le
+        coût est proportionnel à la taille de ces différences, et non à
+        celle de la configuration. Les valeurs appliquées ne sont pas
+        sauvegardées de nouveau.
+
+        Args:
+            validate: Fonction recevant les valeurs modifiées avant
+              qu'elles soient appliquées. Si elle lève `ValueError` ou
+              `TypeError`, aucune valeur n'est appliquée.
+
+        Returns:
+            Les nouvelles valeurs par chemin pointé. Un dictionnaire
+              vide si le fichier n'a pas changé, est illisible (par
+              exemple pendant son écriture) ou est refusé par
+              `validate`. Une liste, comme `Enemies`, est une seule
+              valeur.
+        """
+        stat = self._file_stat()
+        if stat is None or stat == self._stat:
+            return {}
+        try:
+            with open(self.filepath) as file:
+                new = json.load(file)
+        except (OSError, json.JSONDecodeError):
+            return {}  # Réessayé au prochain appel
+
+        old = dict(deep_items(self._update_diffs()))
+        fresh = dict(deep_items(new))
+        defaults = Config.get_instance('defaults')
+        changes: dict[str, Any] = {}
+        for path in old.keys() | fresh.keys():
+            value = fresh[path] if path in fresh else defaults.get(path)
+            if value != self.get(path):
+                changes[path] = value
+        if validate is not None:
+            try:
+                validate(changes)
+            except (ValueError, TypeError):
+                # Refusé : la configuration en mémoire reste intacte, et
+                # le fichier est relu au prochain appel.
+                return {}
+        self._stat = stat
+        for path, value in changes.items():
+            self._assign(path, value)
+        self._diffs = new
+        return changes
+
+    def watch(
+            self, widget: Any,
+            callback: Callable[[dict[str, Any]], None],
+            interval: float = 0.5,
+            validate: Callable[[dict[str, Any]], None] | None = None,
+    ) -> None:
+        """Surveille le fichier depuis la boucle de Tk.
+
+        Toutes les `interval` secondes, `Config.reload` est appelée.
+        Si des valeurs ont changé, `callback` les reçoit. Tant que le
+        fichier ne change pas, un sondage ne coûte qu'un appel à
+        `os.stat`.
+
+        Args:
+            widget: Widget Tk utilisé pour planifier les sondages.
+            callback: Fonction recevant les valeurs modifiées (voir
+              `Config.reload`).
+            interval: Délai entre deux sondages, en secondes.
+            validate: Voir `Config.reload`.
+
+        Note:
+            Une exception de `callback` n'arrête pas la surveillance.
+        """
+        # Une seule comparaison complète, avant le premier sondage
+        self._update_diffs()
+        delay = max(1, round(interval * 1000))
+
+        def poll():
+            try:
+                changes = self.reload(validate)
+                if changes:
+                    callback(changes)
+            finally:
+                widget.after(delay, poll)
+
+        widget.after(delay, poll)
+
+    def _update_diffs(self) -> dict[str, Any]:
+        """Met à jour les différences en mémoire pour les chemins
+        modifiés, puis les retourne.
+
+        La première fois, toute la configuration est comparée. Ensuite,
+        le coût est proportionnel au nombre de chemins modifiés.
+        """
+        defaults = Config.get_instance('defaults')
+        dirty, self._dirty = self._dirty, set()
+        if self._diffs is None:
+            self._diffs = deep_compare(self.config, defaults.config)
+            return self._diffs
+        for path in dirty:
+            keys = path.split(".")
+            value = self.get(path)
+            default = defaults.get(path)
+            if isinstance(value, dict):
+                if not isinstance(default, dict):
+                    default = {}
+                diff = deep_compare(value, default)
+                deep_delete(self._diffs, keys)
+                if diff:
+                    deep_set(self._diffs, keys, diff)
+            elif value != default:
+                deep_set(self._diffs, keys, value)
+            else:
+                deep_delete(self._diffs, keys)
+        return self._diffs
+
+
+def _write_atomic(path: str, text: str | bytes) -> None:
+    """Remplace le contenu d'un fichier d'un coup.
+
+    Le texte est écrit dans un fichier temporaire du même dossier, puis
+    renommé : en cas d'arrêt brutal, le fichier contient l'ancienne ou
+    la nouvelle version, jamais un mélange des deux.
+    """
+    temp = path + ".tmp"
+    with open(temp, 'wb' if isinstance(text, bytes) else 'w') as out:
+        out.write(text)
+        out.flush()
+        os.fsync(out.fileno())
+    os.replace(temp, path)
 
 
 def deep_get(dct: dict, keys, *_keys: Any) -> Any | None:
@@ -166,6 +547,52 @@ def deep_set(dct: dict, keys: Sequence, value: Any) -> None:
     _dict[keys[-1]] = value
 
 
+def deep_items(dct: dict, prefix: str = "") -> Iterator[tuple[str, Any]]:
+    """Parcourt les valeurs d'un dictionnaire imbriqué avec leur chemin
+    pointé. Les dictionnaires vides et les listes sont des valeurs.
+
+    Example:
+        dict(deep_items({"a": {"b": 1}, "c": [2]}))  # {"a.b": 1, "c": [2]}
+    """
+    stack: list[tuple[str, dict[Any, Any]]] = [(prefix, dct)]
+    while stack:
+        keystack, subdict = stack.pop()
+        for key, val in subdict.items():
+            path = f"{keystack}{key}"
+            if isinstance(val, dict) and val:
+                stack.append((path + ".", val))
+            else:
+                yield path, val
+
+
+def deep_delete(dct: dict, keys: Sequence) -> None:
+    """Retire une clé d'un dictionnaire imbriqué.
+
+    Les dictionnaires devenus vides sont aussi retirés. Si une clé est
+    manquante, rien n'est modifié.
+
+    Args:
+        dct: Le dictionnaire à modifier.
+        keys: Une séquence de clés jusqu'à la valeur.
+    """
+    parents = []
+    _dict = dct
+    for key in keys[:-1]:
+        child = _dict.get(key)
+        if not isinstance(child, dict):
+            return
+        parents.append((_dict, key))
+        _dict = child
+    if keys[-1] not in _dict:
+        return
+    del _dict[keys[-1]]
+    # Retire les parents vides, du plus profond au plus haut
+    for parent, key in reversed(parents):
+        if parent[key]:
+            break
+        del parent[key]
+
+
 def deep_update(dct: dict, new: dict) -> None:
     """Implémentation de `dict.update` qui fonctionne sur les
     dictionnaires imbriqués.
@@ -176,42 +603,58 @@ def deep_update(dct: dict, new: dict) -> None:
     utilisée. Si `dct` n'a aucun élément inexistants dans `new`, les
     deux dictionnaires seront identiques.
 
+    Chaque clé de `new` n'est visitée qu'une fois : la complexité est
+    linéaire en nombre de clés.
+
     Args:
         dct: Le dictionnaire à modifier.
         new: Le dictionnaire possédant les clés à ajouter ou modifier.
     """
-    # Afin d'éviter une solution récursive
-    dict.update
-    _stack: list[tuple[tuple[Any, ...], dict[Any, Any]]] = [((), new)]
-    while _stack:
-        keystack, subdict = _stack.pop(0)
+    # Afin d'éviter une solution récursive. Chaque élément de la file
+    # garde le sous-dictionnaire de `dct` correspondant, afin de ne
+    # jamais repartir de la racine.
+    _queue: deque[tuple[dict[Any, Any], dict[Any, Any]]] = deque(
+        [(dct, new)]
+    )
+    while _queue:
+        target, subdict = _queue.popleft()
         for key, val in subdict.items():
-            _keys = (*keystack, key)
             if isinstance(val, dict):
-                _stack.append((_keys, val))
+                child = target.get(key)
+                if not isinstance(child, dict):
+                    child = target[key] = {}
+                _queue.append((child, val))
             else:
-                deep_set(dct, _keys, val)
+                target[key] = val
 
 
 def deep_compare(dct: dict, defaults: dict) -> dict:
     """Calcule la différence entre deux dictionaires.
 
+    Les deux dictionnaires sont parcourus ensemble, en une seule passe :
+    la complexité est linéaire en nombre de clés de `dct`.
+
     Returns:
         Un nouveau dictionaire D tel que `deep_update(dct, D)`
           produise un dictionaire identique à `dct` si `defaults` ne
           possède aucune clé inexistante dans `dct`.
     """
     # Afin d'éviter une solution récursive
-    _stack: list[tuple[tuple[Any, ...], dict[Any, Any]]] = [((), dct)]
+    _queue: deque[tuple[tuple[Any, ...], dict[Any, Any], Any]] = deque(
+        [((), dct, defaults)]
+    )
     _diffs: dict[Any, Any] = {}
-    while _stack:
-        keystack, subdict = _stack.pop(0)
+    while _queue:
+        keystack, subdict, subdefaults = _queue.popleft()
+        if not isinstance(subdefaults, dict):
+            subdefaults = {}
         for key, val in subdict.items():
-            _keys = (*keystack, key)
+            default = subdefaults.get(key)
             if isinstance(val, dict):
-                _stack.append((_keys, val))
-            elif val != deep_get(defaults, _keys):
-                deep_set(_diffs, _keys, val)
+                _queue.append(((*keystack, key), val, default))
+            elif val != default:
+                # Seules les différences repartent de la racine
+                deep_set(_diffs, (*keystack, key), val)
     return _diffs
 
 
@@ -234,6 +677,125 @@ def test_diff_save():
     assert size2 < size1
 
 
+def test_paths():
+    config = Config.get_instance()
+    fill = config.accessor("Enemy.Color.Fill")
+    assert config.get("Game.Size.Width") == config["Game"]["Size"]["Width"]
+    assert config.get("Game.Missing", 42) == 42
+    old = fill()
+    config.set("Enemy.Color.Fill", old + "_")
+    assert fill() == config["Enemy"]["Color"]["Fill"] == old + "_"
+    config.set("Enemy.Color.Fill", old)
+
+    # Les sous-dictionnaires gardent leur identité : les accesseurs
+    # restent valides après une fusion.
+    deep_update(config.config, {"Enemy": {"Color": {"Fill": "green"}}})
+    assert fill() == "green"
+    deep_update(config.config, {"Enemy": {"Color": {"Fill": old}}})
+
+    dct = {"a": {"b": 1, "c": {"d": 2}}, "e": 3}
+    assert deep_compare(dct, {"a": {"b": 1, "c": {"d": 0}}}) == {
+        "a": {"c": {"d": 2}}, "e": 3
+    }
+
+
+def test_save_later():
+    config = Config.get_instance()
+    config.save()
+    with open(config.filepath) as file:
+        before = json.load(file)
+
+    old = config.get("Game.Color.Outline")
+    config.set("Game.Color.Outline", old + "_")
+    config.save_later(delay=60)
+    config.flush()
+    with open(config.filepath) as file:
+        assert json.load(file)["Game"]["Color"]["Outline"] == old + "_"
+
+    # Revenir à la valeur par défaut retire l'entrée et ses parents vides
+    config.set("Game.Color.Outline", old)
+    config.save_later(delay=0.5)
+    # Le minuteur écrit le fichier : on attend la fin de son fil
+    timer = config._timer
+    timer.join()
+    with open(config.filepath) as file:
+        saved = json.load(file)
+    assert saved == before
+    game = saved.get("Game", {})
+    assert "Outline" not in game.get("Color", {})
+    if "Color" not in before.get("Game", {}):
+        assert "Color" not in game
+    if "Game" not in before:
+        assert "Game" not in saved
+    assert not os.path.exists(config.filepath + ".tmp")
+
+    dct = {"a": {"b": {"c": 1}}, "d": 2}
+    deep_delete(dct, ("a", "b", "c"))
+    deep_delete(dct, ("x", "y"))
+    assert dct == {"d": 2}
+
+
+def test_cache():
+    def fresh() -> Config:
+        # Contourne `Multiton` pour relire les fichiers
+        config = Config.__new__(Config)
+        config.__init__("settings")
+        return config
+
+    config = Config.get_instance()
+    config.save()  # Le fichier change : le cache est périmé
+    assert fresh().config == config._parse()
+    key = config._cache_key()
+    with open(config.cachepath, 'rb') as file:
+        assert marshal.load(file)[0] == key
+
+    # Un cache à jour est lu tel quel, sans le JSON
+    with open(config.cachepath, 'wb') as file:
+        marshal.dump((key, {"Cached": True}), file)
+    assert fresh().config == {"Cached": True}
+
+    # Un fichier source modifié reconstruit le cache
+    stat = os.stat(config.filepath)
+    os.utime(config.filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert fresh().config == config._parse()
+
+
+def test_reload():
+    config = Config.get_instance()
+    config.save()
+    assert config.reload() == {}
+    with open(config.filepath) as file:
+        saved = file.read()
+
+    # Modification externe du fichier, comme par un éditeur
+    old = config.get("Game.Loop.TickRate")
+    edited = json.loads(saved)
+    deep_update(edited, {"Game": {"Loop": {"TickRate": old + 1}}})
+    with open(config.filepath, 'w') as file:
+        json.dump(edited, file)
+    assert config.reload() == {"Game.Loop.TickRate": old + 1}
+    assert config.get("Game.Loop.TickRate") == old + 1
+    assert config.reload() == {}
+
+    # Une modification refusée n'est pas appliquée, et reste à relire
+    def reject(changes: dict[str, Any]) -> None:
+        raise ValueError(changes)
+
+    with open(config.filepath, 'w') as file:
+        file.write(saved)
+    assert config.reload(reject) == {}
+    assert config.get("Game.Loop.TickRate") == old + 1
+    assert config.reload() == {"Game.Loop.TickRate": old}
+
+    assert dict(deep_items({"a": {"b": 1, "c": {}}, "d": [2]})) == {
+        "a.b": 1, "a.c": {}, "d": [2]
+    }
+
+
 if __name__ == "__main__":
     test_diff_save()
+    test_paths()
+    test_save_later()
+    test_cache()
+    test_reload()
     print("All test passed")
@@ -30,10 +30,11 @@ Controlleurs:
 
 # Type hinting
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 # Modules standards
 from abc import ABC  # Abstract Base Class
+from datetime import datetime
 import tkinter as tk
 
 # Modules du projet
@@ -44,21 +45,28 @@ from view import (
     HighscoreView,
     GameEndView,
 )
-import c31Geometry.c31Geometry2 as geo  # type: ignore
 from config import Config
-from highscore import HighScore
+from geometry import ViewTransform
+from lazy import lazy_import
+from model import Player, Enemy, SpriteBatch
+from view import create_timer_widget, PerformanceOverlay
+
+# Chargés à la première partie ou au premier score, pas au menu
+gameloop = lazy_import("gameloop")
+highscore = lazy_import("highscore")
+kinetic = lazy_import("kinetic")
+replay = lazy_import("replay")
+settings = lazy_import("settings")
+telemetry = lazy_import("telemetry")
+world = lazy_import("world")
 
 if TYPE_CHECKING:
     from game_engine import Root
-
-from model import Player, Enemy
-
-from view import create_timer_widget
+    from settings import Settings
+    from world import World
 
 __docformat__ = "google"
 
-from view import create_timer_widget
-
 
 class Controller(ABC):
     """#Classe abstraite des controlleurs
@@ -137,9 +145,11 @@ class MenuController(Controller):
         """##Fonction appelée lors de l'appui sur le bouton Nouvelle Partie afin de démarrer une nouvelle partie
         """
         self.frame.destroy()
-        frame = tk.Frame(self.root)
-        game_controller = GameController(self.root, frame)
-        game_controller.initialize()
+        if self.root.game is None:
+            self.root.game = GameController(self.root, tk.Frame(self.root))
+            self.root.game.initialize()
+        else:
+            self.root.game.reset()
 
 
 class GameController(Controller):
@@ -150,8 +160,17 @@ class GameController(Controller):
 
     Attributs:
         - view (GameView): La vue du jeu
+        - settings (Settings): Les paramètres figés de la partie en cours
+        - world (World): La simulation de la partie, dans l'arène logique de `Game.Size`
+        - transform (ViewTransform): Le passage des coordonnées de l'arène à celles du canvas
+        - kinetic (KineticSimulation | None): La simulation par événements, si ce mode est choisi
+        - recorder (Recorder | None): L'enregistrement des entrées de la partie, s'il est activé
         - player (Player): Le joueur
-        - enemies (list[Enemy]): La liste des ennemis
+        - steps (int): Le nombre d'étapes d'un déplacement du joueur (interpolation)
+        - enemies (list[Enemy]): La liste des ennemis, dont les rectangles sont réutilisés d'une partie à l'autre
+        - batch (SpriteBatch): L'affichage groupé des ennemis
+        - loop (GameLoop): La boucle de jeu qui fait avancer les ennemis
+        - overlay (PerformanceOverlay): Les compteurs de performance, affichés ou cachés par une touche
         - root (Root): La fenêtre principale du jeu
         - frame (tk.Frame): Le frame dans lequel le controlleur est affiché
     """
@@ -161,58 +180,121 @@ class GameController(Controller):
         self.view = GameView(root, frame)
 
     def initialize(self) -> None:
-        """##Fonction appelée pour démarrer une nouvelle partie
+        """##Fonction appelée pour démarrer la première partie
 
-        Cette fonction initialise les objets du jeu et les affiche
-        Elle est appelée lors de l'appui sur le bouton Nouvelle Partie
+        Cette fonction crée le canvas et les objets du jeu, puis démarre une partie avec `reset`. Les parties suivantes
+        réutilisent le même canvas et les mêmes rectangles.
 
         Initalise:
             - Le joueur
             - Les ennemis
             - Le timer
         """
-        config = Config.get_instance()
+        snapshot = settings.snapshot()
+        game = snapshot.game
 
-        width = self.root.winfo_screenwidth()
-        height = self.root.winfo_screenheight()
         self.frame.place(anchor=tk.CENTER)
         self.view.draw()
+        # Le canvas a la taille de l'arène, puis suit celle de la fenêtre
         canvas = tk.Canvas(
             self.frame,
-            width=width,
-            height=height,
-            background=config["Game"]["Color"]["Fill"],
+            width=game.width,
+            height=game.height,
+            background=game.fill,
+            highlightthickness=0,
         )
         timer_widget = create_timer_widget(canvas)
 
-        canvas.pack()
-        self.frame.update()
+        canvas.pack(fill=tk.BOTH, expand=True)
         
-        # Crée le joueur
+        # Crée la simulation, puis les sprites qui la reflètent
+        self.transform = ViewTransform()
+        self.world = world.World.from_settings(
+            snapshot, game.width, game.height
+        )
         self.player = Player(
-                canvas,
+                canvas, self.world,
                 timer_widget=timer_widget,
-                endgame=self.on_game_end
+                endgame=self.on_game_end,
+                transform=self.transform,
+                settings=snapshot,
         )
-        
         self.enemies: list[Enemy] = []
-        for enemy in config["Enemies"]:
-            
-            pos = enemy["Position"]
-            speed = enemy["Speed"]
-            size = enemy["Size"]
-
-            self.enemies.append(
-                Enemy(
-                    canvas,
-                    pos=geo.Point(pos["X"], pos["Y"]),
-                    width=size["Width"], height=size["Height"],
-                    speed=geo.Vecteur(speed["X"], speed["Y"]),
-                    player=self.player
-                )
+        canvas.bind("<Configure>", self.on_resize)
+
+        self.loop = gameloop.GameLoop(
+            canvas, game.tick_rate, self.tick, self.render,
+            game.max_catchup, game.max_lag,
+        )
+        self.overlay = PerformanceOverlay(
+            canvas, self.loop, self.world,
+            game.overlay_interval, game.overlay_visible, game.outline,
+        )
+        canvas.bind(game.overlay_key, self.overlay.toggle)
+        self.reset(self.world, snapshot)
+
+    def reset(
+            self, simulation: World | None = None,
+            snapshot: Settings | None = None,
+    ) -> None:
+        """##Fonction appelée pour démarrer une nouvelle partie sur le canvas existant
+
+        Seul l'état de la partie est recréé. Les rectangles des ennemis sont réutilisés, et ceux en trop sont cachés
+        plutôt que détruits.
+
+        Args:
+            - simulation (World | None): La simulation de la partie. Par défaut, une nouvelle simulation de la taille de
+              `Game.Size`.
+            - snapshot (Settings | None): Les paramètres figés de la partie. Par défaut, la configuration est figée
+              ici : la modifier pendant la partie n'a aucun effet avant la suivante.
+        """
+        if snapshot is None:
+            snapshot = settings.snapshot()
+        self.settings = snapshot
+        game = snapshot.game
+        canvas = self.player.canvas
+        if simulation is None:
+            simulation = world.World.from_settings(
+                snapshot, game.width, game.height
             )
-        
-        self.player.canvas.tag_bind(
+        self.world = simulation
+
+        self.recorder = None
+        if game.record:
+            # Le replay garde sa propre copie de la configuration complète
+            self.recorder = replay.Recorder(
+                Config.get_instance(), self.world.width, self.world.height
+            )
+        self.player.reset(simulation, snapshot)
+        self.steps = game.interpolation
+
+        color = snapshot.enemy.fill
+        bodies = list(simulation.enemies)
+        for enemy, body in zip(self.enemies, bodies):
+            enemy.attach(body)
+            canvas.itemconfigure(enemy.sprite, fill=color, state=tk.NORMAL)
+        for body in bodies[len(self.enemies):]:
+            self.enemies.append(Enemy(
+                canvas, body, transform=self.transform, settings=snapshot
+            ))
+        for enemy in self.enemies[len(bodies):]:
+            canvas.itemconfigure(enemy.sprite, state=tk.HIDDEN)
+        self.batch = SpriteBatch(
+            canvas, simulation.enemies,
+            [enemy.sprite for enemy in self.enemies[:len(bodies)]],
+            self.transform,
+        )
+
+        mode = kinetic.SimulationMode[game.mode]
+        self.kinetic = None
+        if mode is kinetic.SimulationMode.KINETIC:
+            self.kinetic = kinetic.KineticSimulation(self.world)
+
+        self.loop.reset()
+        self.overlay.world = simulation
+        canvas.focus_set()
+        # L'identifiant permet de libérer la commande Tcl au démarrage
+        self._start_id = canvas.tag_bind(
             self.player.sprite, "<Button-1>", self.start
         )
         self.view.draw()
@@ -225,19 +307,185 @@ class GameController(Controller):
         Attributs:
            - _ (tk.Event): L'événement qui a appelé la fonction
         ."""
-        self.player.canvas.tag_unbind(self.player.sprite, "<Button-1>")
+        self.player.canvas.tag_unbind(
+            self.player.sprite, "<Button-1>", self._start_id
+        )
         self.player.score.start()
-        
-        for enemy in self.enemies:
-            enemy.start_move()
+        self.loop.start()
+
+    def tick(self) -> None:
+        """##Avance tous les éléments du jeu d'un tick.
 
-    def on_game_end(self) -> None:
+        La dernière position demandée par le joueur est appliquée, puis la simulation avance d'un tick. Rien n'est
+        affiché ici : la boucle de jeu peut exécuter plusieurs ticks avant un seul appel à `render`.
+        """
+        target = self.player.take_target()
+        if target is not None:
+            if self.recorder is not None:
+                self.recorder.move(self.loop.ticks, *target)
+            #  Arrête le déplacement si le joueur touche un mur.
+            if not self.world.drag_player(*target, self.steps):
+                self.on_game_end()
+                return
+
+        if self.kinetic is None:
+            collided = self.world.step()
+        else:
+            collided = self.kinetic.advance(self.loop.ticks + 1)
+        if collided:
+            # La boucle ne compte le tick qu'après le retour de `tick`
+            self.on_game_end(self.loop.ticks + 1)
+
+    def render(self) -> None:
+        """##Reflète l'état de la simulation sur le canvas.
+
+        Les ennemis sont affichés en un seul appel à Tcl. Cette fonction n'est pas appelée pour les ticks que la
+        boucle de jeu doit rattraper.
+        """
+        if self.kinetic is not None:
+            # Les positions ne sont calculées que pour l'affichage
+            self.kinetic.sync()
+        self.player.redraw()
+        self.batch.redraw()
+        self.player.score.excluded = self.dropped_time()
+        self.player.score.refresh()
+        self.overlay.refresh()
+
+    def on_resize(self, event: tk.Event) -> None:
+        """##Fonction appelée lorsque le canvas change de taille afin d'adapter l'affichage de l'arène
+
+        L'arène garde la taille logique de `Game.Size` : seule la transformation vers le canvas change, et la
+        simulation ne dépend donc pas de l'écran.
+        """
+        self.transform.fit(
+            self.world.width, self.world.height, event.width, event.height
+        )
+        self.player.draw_border()
+        self.render()
+
+    def on_game_end(self, ticks: int | None = None) -> None:
         """##Fonction appelée lorsque la partie est terminée afin d'afficher le menu de score et de sauvegarder le
-        score """
-        self.frame.destroy()
+        score
+
+        Args:
+            - ticks (int | None): Le nombre de ticks exécutés par la partie, y compris le tick en cours s'il a été
+              exécuté. Par défaut, le nombre de ticks terminés de la boucle.
+        """
+        if ticks is None:
+            ticks = self.loop.ticks
+        self.loop.stop()
+        self.player.score.stop()
+        # Le temps des ticks abandonnés n'a pas été joué
+        self.player.score.excluded = self.dropped_time()
+        if self.recorder is not None:
+            replay.get_writer().record(
+                self.recorder, ticks, self.player.score.value,
+                self.settings.game.keep_replays,
+            )
+        if self.settings.game.telemetry:
+            telemetry.get_writer().record(self.telemetry(ticks))
+        # Le canvas est gardé pour la prochaine partie (voir `reset`)
+        self.frame.pack_forget()
         controller = GameEndController(self.root, self.player.score.value)
 
 
+    def dropped_time(self) -> int:
+        """##Fonction qui retourne la durée des ticks abandonnés par la boucle de jeu, en millisecondes"""
+        return round(self.loop.dropped * self.loop.period * 1000)
+
+    def apply_settings(self, changes: dict[str, Any]) -> None:
+        """##Fonction appelée lorsque la configuration est modifiée pendant l'exécution afin de l'appliquer à la partie
+
+        Seules les valeurs modifiées sont traitées. Les couleurs, la vitesse des ennemis, la cadence de la boucle,
+        l'interpolation et l'affichage des performances changent tout de suite, sans recommencer la partie. Les autres
+        valeurs (taille de l'arène, nombre ou position des ennemis, mode de simulation...) s'appliquent à la prochaine
+        partie.
+
+        Args:
+            - changes (dict[str, Any]): Les nouvelles valeurs par chemin pointé (voir `Config.reload`)
+
+        Note:
+            - Un changement qui modifie la simulation arrête l'enregistrement de la partie : le replay ne pourrait plus
+              la reproduire.
+        """
+        old, self.settings = self.settings, self.settings.updated(changes)
+        game = self.settings.game
+        canvas = self.player.canvas
+
+        if "Game.Color.Fill" in changes:
+            canvas.configure(background=game.fill)
+        if "Game.Color.Outline" in changes:
+            canvas.itemconfigure(self.player.border_rect, outline=game.outline)
+            self.overlay.color = game.outline
+            canvas.itemconfigure(self.overlay.item, fill=game.outline)
+        if "Player.Color.Fill" in changes:
+            canvas.itemconfigure(self.player.sprite, fill=self.settings.player.fill)
+        if "Enemy.Color.Fill" in changes:
+            for enemy in self.enemies:
+                canvas.itemconfigure(enemy.sprite, fill=self.settings.enemy.fill)
+        if "Game.Overlay.Interval" in changes:
+            self.overlay.interval = game.overlay_interval
+        if "Game.Overlay.Key" in changes:
+            canvas.unbind(old.game.overlay_key)
+            canvas.bind(game.overlay_key, self.overlay.toggle)
+        if "Game.Loop.MaxCatchup" in changes:
+            self.loop.max_catchup = game.max_catchup
+        if "Game.Loop.MaxLag" in changes:
+            self.loop.max_lag = game.max_lag
+
+        simulated = False
+        if "Game.Loop.TickRate" in changes:
+            # Pris en compte dès la prochaine échéance de la boucle
+            self.loop.rate = game.tick_rate
+            simulated = True
+        if "Game.Input.Interpolation" in changes:
+            self.steps = game.interpolation
+            simulated = True
+        if "Enemies" in changes:
+            speeds = [(spec.speed_x, spec.speed_y) for spec in self.settings.enemies]
+            if self.kinetic is not None:
+                self.kinetic.sync()
+                self.world.set_speeds(speeds)
+                self.kinetic.restart()
+            else:
+                self.world.set_speeds(speeds)
+            simulated = True
+        if simulated:
+            self.recorder = None
+
+    def telemetry(self, ticks: int | None = None) -> dict:
+        """##Fonction appelée à la fin de la partie afin de résumer ses performances
+
+        Args:
+            - ticks (int | None): Le nombre de ticks de la partie (voir `on_game_end`)
+
+        Retourne:
+            - Un enregistrement pour `telemetry.TelemetryWriter`
+        """
+        loop, score = self.loop, self.player.score.value
+        return {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "score": score,
+            "ticks": loop.ticks if ticks is None else ticks,
+            "frames": loop.frames,
+            "late": loop.late,
+            "skipped": loop.skipped,
+            "dropped": loop.dropped,
+            "tick_histogram": {
+                "bounds_ms": [
+                    bound * 1e3 for bound in gameloop.HISTOGRAM_BOUNDS
+                ],
+                "counts": loop.histogram,
+            },
+            "input_rate": self.player.events / max(score / 1000, 1e-3),
+            "max_frame_gap_ms": loop.max_gap * 1e3,
+            "enemies": len(self.world.enemies),
+            "difficulty": self.settings.game.difficulty,
+            "mode": self.settings.game.mode,
+            "host": telemetry.host_info(),
+        }
+
+
 class GameEndController(Controller):
     """#Controlleur de fin de partie
     
@@ -254,7 +502,7 @@ class GameEndController(Controller):
         - view (GameEndView): La vue de fin de partie
         - root (Root): La fenêtre principale du jeu
         - frame (tk.Frame): Le frame dans lequel le controlleur est affiché
-        - score (int): Le score du joueur
+        - score (int): Le score du joueur, en millisecondes
     """
     def __init__(self, root: Root, score: int):
         """"""
@@ -279,13 +527,15 @@ class GameEndController(Controller):
         name = self.view.nameEntry.get()  # Prend le nom du joueur
         if name:  # Si le nom n'est pas vide
             self.view.destroy()
-            HighScore.save_score(name, self.score)
-            highscore = HighscoreController(self.root, self.frame)
-            highscore.start()
+            highscore.HighScore.save_score(name, self.score)
+            highscores = HighscoreController(self.root, self.frame)
+            highscores.start()
 
     def on_menu(self, _) -> None:
         """##Fonction appelée lorsque le joueur appuie sur le bouton Menu afin de revenir au menu"""
         self.view.destroy()
+        # Le frame n'est utilisé que par le tableau des highscores
+        self.frame.destroy()
         menu = MenuController(self.root)
         menu.start()
 
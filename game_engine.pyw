@@ -26,7 +26,9 @@ la boucle principale du jeu."""
 # Modules standard
 import tkinter as tk
 
-from controller import MenuController
+import assets
+from config import Config
+from controller import MenuController, GameController
 
 __docformat__ = "google"
 
@@ -36,14 +38,43 @@ class Root(tk.Tk):
 
     Attributs:
         menu (MenuController): Controlleur du menu
+        game (GameController | None): Controlleur du jeu, gardé entre
+          les parties afin de réutiliser son canvas
+
+    Note:
+        Si `Game.HotReload.Enabled` est vrai, les modifications de
+        `Data/settings.json` sont appliquées à la partie en cours.
         """
     def __init__(self):
         """"""  # Pour que le docstring soit correctement affiché sur pdoc
         super().__init__()
         self.title("Jeu du carré rouge")
+        assets.preload(self)
 
+        self.game: GameController | None = None
         self.menu = MenuController(self)
 
+        config = Config.get_instance()
+        if config.get("Game.HotReload.Enabled"):
+            from settings import check
+
+            # Une erreur de saisie est ignorée jusqu'à sa correction
+            config.watch(
+                self, self.on_config_change,
+                config.get("Game.HotReload.Interval"),
+                validate=check,
+            )
+
+    def on_config_change(self, changes: dict) -> None:
+        """##Applique au jeu les valeurs modifiées dans le fichier de
+        configuration.
+
+        Args:
+            changes: Nouvelles valeurs par chemin pointé.
+        """
+        if self.game is not None:
+            self.game.apply_settings(changes)
+
 
 if __name__ == "__main__":
     """Lancement du jeu
@@ -0,0 +1,270 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""#Module de la boucle de jeu.
+
+Classe:
+    - GameLoop: Planificateur à cadence fixe de la partie.
+
+Notes:
+    - Un seul rappel `after` de Tk est armé à la fois, peu importe le
+      nombre d'entités à faire avancer.
+    - Les ticks sont planifiés par rapport à `time.perf_counter`, et non
+      l'un après l'autre : un rappel en retard ne décale pas les
+      suivants, et la vitesse du jeu reste fidèle au temps réel.
+    - Un affichage lent ne ralentit pas le jeu : tous les ticks en
+      retard sont rattrapés, et seuls les rendus sont sautés.
+"""
+# Documentation
+from __future__ import annotations
+from typing import Callable
+
+# Modules standards
+from bisect import bisect_left
+from time import perf_counter
+import time
+import tkinter as tk
+
+__docformat__ = "google"
+
+HISTOGRAM_BOUNDS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+)
+"""Bornes supérieures des classes de `GameLoop.histogram`, en secondes.
+La dernière classe reçoit les ticks plus longs."""
+
+
+class GameLoop:
+    """#Planificateur à cadence fixe de la partie.
+
+    À chaque tick, la fonction `update` est appelée une seule fois et
+    doit faire avancer toutes les entités du jeu. La fonction `render`
+    affiche ensuite le résultat. Si un rappel arrive en retard d'un tick
+    ou plus, les ticks manqués sont rattrapés avant un seul rendu : la
+    simulation n'est pas sautée, seulement l'affichage.
+
+    Attributs:
+        - widget: Widget Tk utilisé pour planifier les rappels.
+        - rate: Nombre de ticks par seconde.
+        - update: Fonction appelée à chaque tick.
+        - render: Fonction appelée après les ticks d'un rappel.
+        - max_catchup: Nombre maximal de ticks exécutés par rappel. Les
+          ticks suivants sont exécutés au prochain rappel, sans rendu
+          entre les deux.
+        - max_lag: Retard maximal rattrapé, en secondes.
+        - ticks: Nombre de ticks exécutés depuis le démarrage.
+        - frames: Nombre de rendus depuis le démarrage.
+        - late: Nombre de rappels arrivés au moins un tick en retard.
+        - skipped: Nombre de ticks exécutés sans être affichés.
+        - dropped: Nombre de ticks abandonnés au-delà de `max_lag`. Le
+          jeu a été ralenti d'autant de ticks.
+        - lateness: Retard du dernier rappel sur son échéance, en
+          secondes.
+        - last_duration: Durée du dernier tick, en secondes.
+        - last_render: Durée du dernier rendu, en secondes.
+        - histogram: Nombre de ticks par classe de durée (voir
+          `HISTOGRAM_BOUNDS`).
+        - max_gap: Plus long intervalle entre deux rendus, en secondes.
+        - running: Booléen indiquant si la boucle est active.
+
+    Note:
+        - Entre deux rappels, Tk traite les événements en attente : un
+          long rattrapage ne gèle pas la fenêtre.
+        - Au-delà de `max_lag` secondes de retard, les ticks manqués
+          sont abandonnés (voir `dropped`) plutôt que de rattraper sans
+          fin une machine dont les ticks sont plus lents que la cadence.
+        """
+    def __init__(
+            self, widget: tk.Misc,
+            rate: float,
+            update: Callable[[], None],
+            render: Callable[[], None] | None = None,
+            max_catchup: int = 5,
+            max_lag: float = 1.0,
+    ):
+        """"""
+        self.widget = widget
+        self.rate = rate
+        self.update = update
+        self.render = render
+        self.max_catchup = max_catchup
+        self.max_lag = max_lag
+        self.ticks = 0
+        self.frames = 0
+        self.late = 0
+        self.skipped = 0
+        self.dropped = 0
+        self.lateness = 0.0
+        self.last_duration = 0.0
+        self.last_render = 0.0
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+        self.max_gap = 0.0
+        self.running = False
+        self._deadline = 0.0
+        self._last_frame = 0.0
+        self._unrendered = 0
+        self._after_id: str | None = None
+
+    @property
+    def period(self) -> float:
+        """##Durée d'un tick, en secondes."""
+        return 1 / self.rate
+
+    @property
+    def delay(self) -> int:
+        """##Délai entre deux ticks, en millisecondes."""
+        return max(1, round(1000 / self.rate))
+
+    def reset(self) -> None:
+        """##Remet les compteurs à zéro pour une nouvelle partie."""
+        if self.running:
+            raise RuntimeError("Reset a running game loop")
+        self.ticks = self.frames = self.late = self.skipped = 0
+        self.dropped = self._unrendered = 0
+        self.lateness = self.last_duration = self.last_render = 0.0
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+        self.max_gap = 0.0
+
+    def start(self) -> None:
+        """##Démarre la boucle."""
+        if self.running:
+            raise RuntimeError("Started game loop twice")
+        self.running = True
+        self._last_frame = perf_counter()
+        self._deadline = self._last_frame + self.period
+        self._after_id = self.widget.after(self.delay, self._run)
+
+    def stop(self) -> None:
+        """##Arrête la boucle. Peut être appelée pendant un tick."""
+        self.running = False
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _run(self) -> None:
+        """##Exécute les ticks échus, affiche, puis planifie le suivant."""
+        self._after_id = None
+        period = self.period
+        now = perf_counter()
+        self.lateness = now - self._deadline
+        if self.lateness >= period:
+            self.late += 1
+        if self.lateness > self.max_lag:
+            # Trop en retard : les ticks au-delà du dernier sont abandonnés
+            missed = int(self.lateness / period)
+            self.dropped += missed
+            self._deadline += missed * period
+
+        done = 0
+        while (self.running and now >= self._deadline
+               and done < self.max_catchup):
+            start = perf_counter()
+            self.update()
+            duration = self.last_duration = perf_counter() - start
+            self.histogram[bisect_left(HISTOGRAM_BOUNDS, duration)] += 1
+            self.ticks += 1
+            self._deadline += period
+            done += 1
+        self._unrendered += done
+
+        # `update` peut avoir arrêté la boucle (fin de partie).
+        if not self.running:
+            return
+        if now >= self._deadline:
+            # Encore en retard : Tk reprend la main, puis le rattrapage
+            # continue sans afficher.
+            self._after_id = self.widget.after(0, self._run)
+            return
+        if self._unrendered:
+            start = perf_counter()
+            self.max_gap = max(self.max_gap, start - self._last_frame)
+            self._last_frame = start
+            if self.render is not None:
+                self.render()
+                self.last_render = perf_counter() - start
+            self.frames += 1
+            self.skipped += self._unrendered - 1
+            self._unrendered = 0
+
+        delay = round((self._deadline - perf_counter()) * 1000)
+        self._after_id = self.widget.after(max(0, delay), self._run)
+
+
+class _StubWidget:
+    """Remplace le widget Tk dans les tests : un seul rappel en attente,
+    appelé par `run` après son délai."""
+    def __init__(self):
+        self.pending: tuple[int, Callable[[], None]] | None = None
+
+    def after(self, delay: int, callback: Callable[[], None]) -> str:
+        self.pending = (delay, callback)
+        return "after"
+
+    def after_cancel(self, _) -> None:
+        self.pending = None
+
+    def run(self, duration: float) -> None:
+        end = perf_counter() + duration
+        while self.pending is not None and perf_counter() < end:
+            (delay, callback), self.pending = self.pending, None
+            time.sleep(delay / 1000)
+            callback()
+
+
+def test_slow_render_keeps_pace():
+    # Un rendu de 15 ms à 200 ticks par seconde : environ 3 ticks par
+    # rendu, tous exécutés.
+    widget = _StubWidget()
+    loop = GameLoop(
+        widget, 200, lambda: None, lambda: time.sleep(0.015),
+        max_catchup=2,
+    )
+    start = perf_counter()
+    loop.start()
+    widget.run(0.5)
+    expected = (perf_counter() - start) * loop.rate
+    loop.stop()
+    assert loop.dropped == 0
+    assert abs(loop.ticks - expected) <= 0.05 * expected + 2
+    assert loop.skipped > 0
+    assert loop.ticks == loop.skipped + loop.frames + loop._unrendered
+
+
+def test_stall_drops_ticks():
+    # Un tick de 300 ms dépasse `max_lag` : le retard est compté dans
+    # `dropped`, et la somme reste fidèle au temps réel.
+    stalls = [0.3]
+    widget = _StubWidget()
+    loop = GameLoop(
+        widget, 200, lambda: time.sleep(stalls.pop() if stalls else 0),
+        max_lag=0.1,
+    )
+    start = perf_counter()
+    loop.start()
+    widget.run(0.5)
+    expected = (perf_counter() - start) * loop.rate
+    loop.stop()
+    assert loop.dropped >= 0.2 * loop.rate - 1
+    assert abs(loop.ticks + loop.dropped - expected) <= 0.05 * expected + 2
+
+
+if __name__ == "__main__":
+    test_slow_render_keeps_pace()
+    test_stall_drops_ticks()
+    print("All test passed")
@@ -0,0 +1,201 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""#Module des primitives géométriques du jeu.
+
+Les objets de ce module sont compacts (`__slots__`) et se modifient sur
+place, afin que le chemin d'un tick n'ait pas à créer de nouveaux
+objets à chaque déplacement.
+
+Classes:
+    - Vec2: Vecteur ou point en deux dimensions.
+    - AABB: Boîte alignée sur les axes, définie par son centre.
+    - ViewTransform: Passage des coordonnées de l'arène à l'écran.
+"""
+# Documentation
+from __future__ import annotations
+from typing import Iterator
+
+__docformat__ = "google"
+
+
+class Vec2:
+    """#Vecteur ou point en deux dimensions, modifiable sur place.
+
+    Attributs:
+        - x: Composante horizontale.
+        - y: Composante verticale.
+        """
+    __slots__ = ("x", "y")
+
+    def __init__(self, x: float = 0.0, y: float = 0.0):
+        """"""
+        self.x = x
+        self.y = y
+
+    def __iter__(self) -> Iterator[float]:
+        """Permet de décomposer le vecteur : `canvas.move(item, *vec)`."""
+        yield self.x
+        yield self.y
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Vec2):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y
+
+    def __repr__(self) -> str:
+        return f"Vec2({self.x!r}, {self.y!r})"
+
+    def copy(self) -> Vec2:
+        """##Retourne une copie du vecteur."""
+        return Vec2(self.x, self.y)
+
+    def set(self, x: float, y: float) -> Vec2:
+        """##Remplace les composantes. Retourne le vecteur lui-même."""
+        self.x = x
+        self.y = y
+        return self
+
+    def add(self, dx: float, dy: float) -> Vec2:
+        """##Ajoute (`dx`, `dy`) sur place. Retourne le vecteur lui-même."""
+        self.x += dx
+        self.y += dy
+        return self
+
+    def __iadd__(self, other: Vec2) -> Vec2:
+        return self.add(other.x, other.y)
+
+    def __isub__(self, other: Vec2) -> Vec2:
+        return self.add(-other.x, -other.y)
+
+    def scale(self, factor: float) -> Vec2:
+        """##Multiplie sur place. Retourne le vecteur lui-même."""
+        self.x *= factor
+        self.y *= factor
+        return self
+
+
+class AABB:
+    """#Boîte alignée sur les axes, définie par son centre.
+
+    Attributs:
+        - x, y: Centre de la boîte.
+        - hw, hh: Demi-largeur et demi-hauteur.
+        """
+    __slots__ = ("x", "y", "hw", "hh")
+
+    def __init__(self, x: float, y: float, width: float, height: float):
+        """Crée une boîte centrée sur (`x`, `y`)."""
+        self.x = x
+        self.y = y
+        self.hw = width / 2
+        self.hh = height / 2
+
+    @property
+    def width(self) -> float:
+        """##Largeur de la boîte."""
+        return self.hw * 2
+
+    @property
+    def height(self) -> float:
+        """##Hauteur de la boîte."""
+        return self.hh * 2
+
+    @property
+    def box(self) -> tuple[float, float, float, float]:
+        """##Coordonnées (x1, y1, x2, y2), dans l'ordre de Tk."""
+        x, y, hw, hh = self.x, self.y, self.hw, self.hh
+        return x - hw, y - hh, x + hw, y + hh
+
+    def corners(self, p1: Vec2, p2: Vec2) -> None:
+        """##Écrit les coins ↖ et ↘ de la boîte dans `p1` et `p2`."""
+        x, y, hw, hh = self.x, self.y, self.hw, self.hh
+        p1.x, p1.y = x - hw, y - hh
+        p2.x, p2.y = x + hw, y + hh
+
+    def move(self, dx: float, dy: float) -> None:
+        """##Déplace la boîte d'un vecteur (`dx`, `dy`)."""
+        self.x += dx
+        self.y += dy
+
+    def moveto(self, x: float, y: float) -> None:
+        """##Centre la boîte sur (`x`, `y`)."""
+        self.x = x
+        self.y = y
+
+    def inside(self, x1: float, y1: float, x2: float, y2: float) -> bool:
+        """##Vérifie que la boîte est strictement dans une zone."""
+        x, y, hw, hh = self.x, self.y, self.hw, self.hh
+        return (x1 < x - hw < x + hw < x2
+                and y1 < y - hh < y + hh < y2)
+
+    def overlaps(self, other: AABB) -> bool:
+        """##Vérifie si deux boîtes se touchent ou se chevauchent."""
+        return (abs(self.x - other.x) <= self.hw + other.hw
+                and abs(self.y - other.y) <= self.hh + other.hh)
+
+
+class ViewTransform:
+    """#Passage des coordonnées logiques de l'arène à celles du canvas.
+
+    La simulation travaille toujours dans l'arène de `Game.Size`. Le
+    canvas l'affiche agrandie de `scale`, puis décalée de (`x`, `y`).
+
+    Attributs:
+        - scale: Facteur d'agrandissement.
+        - x: Décalage horizontal, en pixels.
+        - y: Décalage vertical, en pixels.
+        """
+    __slots__ = ("scale", "x", "y")
+
+    def __init__(self, scale: float = 1.0, x: float = 0.0, y: float = 0.0):
+        """"""
+        self.scale = scale
+        self.x = x
+        self.y = y
+
+    @property
+    def identity(self) -> bool:
+        """##Vrai si les coordonnées logiques sont celles du canvas."""
+        return self.scale == 1 and self.x == 0 and self.y == 0
+
+    def fit(
+            self, width: float, height: float,
+            screen_width: float, screen_height: float,
+    ) -> None:
+        """##Agrandit l'arène autant que possible dans l'écran, en gardant
+        ses proportions, puis la centre."""
+        self.scale = min(screen_width / width, screen_height / height)
+        self.x = (screen_width - width * self.scale) / 2
+        self.y = (screen_height - height * self.scale) / 2
+
+    def to_screen(self, x: float, y: float) -> tuple[float, float]:
+        """##Position à l'écran d'un point de l'arène."""
+        return x * self.scale + self.x, y * self.scale + self.y
+
+    def to_world(self, x: float, y: float) -> tuple[float, float]:
+        """##Position dans l'arène d'un point de l'écran."""
+        return (x - self.x) / self.scale, (y - self.y) / self.scale
+
+    def box(
+            self, x1: float, y1: float, x2: float, y2: float
+    ) -> tuple[float, float, float, float]:
+        """##Coordonnées à l'écran d'une boîte (x1, y1, x2, y2)."""
+        s, x, y = self.scale, self.x, self.y
+        return x1 * s + x, y1 * s + y, x2 * s + x, y2 * s + y
@@ -82,6 +82,12 @@ class HighScore:
                 Date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )"""
         )
+        # Version 1 : les scores sont en millisecondes plutôt qu'en
+        # secondes.
+        version, = con.execute("PRAGMA user_version").fetchone()
+        if version < 1:
+            con.execute("UPDATE HighScores SET Score = Score * 1000")
+            con.execute("PRAGMA user_version = 1")
         con.commit()
 
         return con
@@ -92,7 +98,7 @@ class HighScore:
 
         Args:
             name: Le nom du joueur à utiliser pour la ligne.
-            score: Le nombre de secondes que le joueur a survécu.
+            score: Le nombre de millisecondes que le joueur a survécu.
         """
         con = HighScore.connect()
         con.cursor().execute(f"""
@@ -114,13 +120,14 @@ class HighScore:
 
         Args:
             order: Colonne à utiliser pour l'ordre des scores. Par
-              défaut, les scores les plus hauts sont en premier.
+              défaut, les scores les plus hauts sont en premier. À
+              égalité, le score enregistré en premier l'emporte.
         """
         con = HighScore.connect()
         cur = con.cursor()
 
         exc = cur.execute(
-            f"SELECT * FROM HighScores ORDER BY {order} DESC"
+            f"SELECT * FROM HighScores ORDER BY {order} DESC, ID ASC"
         )
 
         result = exc.fetchall()
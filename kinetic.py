@@ -0,0 +1,413 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""#Module de la simulation cinétique (par événements) d'une partie.
+
+Entre deux rebonds, un ennemi se déplace en ligne droite. Le prochain
+rebond de chaque ennemi et son premier contact possible avec le joueur
+(immobile entre deux mouvements) se calculent donc exactement. Une file
+de priorité de ces événements remplace la vérification à chaque tick :
+le travail ne dépend que du nombre d'événements, et les positions ne
+sont évaluées qu'au moment d'afficher.
+
+Classes:
+    - SimulationMode: Enumération des modes de simulation.
+    - Trajectory: Trajectoire périodique d'un ennemi, en forme close.
+    - KineticSimulation: Simulation par événements d'un `world.World`.
+
+Fonctions:
+    - layout_of: Disposition des ennemis d'une partie.
+    - trajectories: Trajectoires d'une disposition, mises en cache.
+
+Notes:
+    - Les ennemis rebondissent exactement sur les murs, alors que le
+      mode par tick inverse la vitesse après avoir dépassé le mur. Les
+      deux modes peuvent donc diverger de quelques pixels.
+    - Le temps est exprimé en ticks, mais peut être fractionnaire.
+"""
+# Documentation
+from __future__ import annotations
+
+# Modules standards
+from enum import Enum
+from functools import lru_cache
+import heapq
+import math
+
+# Modules de projet
+from world import World
+
+__docformat__ = "google"
+
+_WALL_X, _WALL_Y, _CONTACT = range(3)
+"""Types d'événements, dans l'ordre de traitement à temps égal."""
+
+Layout = tuple[tuple[float, float, float, float, float, float], ...]
+"""Un tuple (x, y, hw, hh, vx, vy) par ennemi."""
+
+
+class SimulationMode(Enum):
+    """#Enumération des modes de simulation"""
+    TICK = 1  # -> Default for production
+    KINETIC = 2
+
+
+class Trajectory:
+    """#Trajectoire périodique d'un ennemi, en forme close.
+
+    Un ennemi à vitesse constante qui rebondit dans une arène fixe suit
+    une onde triangulaire sur chaque axe. La position à n'importe quel
+    temps se calcule donc en temps constant, sans simuler ce qui
+    précède.
+
+    Attributs:
+        - axes: Pour chaque axe, (minimum, amplitude, phase, vitesse).
+        """
+    __slots__ = ("axes",)
+
+    def __init__(
+            self, x: float, y: float,
+            hw: float, hh: float,
+            vx: float, vy: float,
+            width: float, height: float,
+    ):
+        """Crée la trajectoire d'un ennemi au temps 0."""
+        axes = []
+        for start, half, speed, size in (
+                (x, hw, vx, width), (y, hh, vy, height)
+        ):
+            low, span = half, size - 2 * half
+            if span <= 0 or speed == 0:
+                # Coincé ou immobile sur cet axe
+                axes.append((start, 0.0, 0.0, 0.0))
+                continue
+            offset = min(max(start - low, 0.0), span)
+            # La phase parcourt [0, 2 * span) : montée puis descente
+            phase = offset if speed > 0 else 2 * span - offset
+            axes.append((low, span, phase, abs(speed)))
+        self.axes = tuple(axes)
+
+    def position(self, time: float) -> tuple[float, float]:
+        """##Retourne le centre de l'ennemi au temps donné."""
+        (lx, sx, px, vx), (ly, sy, py, vy) = self.axes
+        return _fold(lx, sx, px + vx * time), _fold(ly, sy, py + vy * time)
+
+    def velocity(self, time: float) -> tuple[float, float]:
+        """##Retourne la vitesse de l'ennemi au temps donné."""
+        result = []
+        for _, span, phase, speed in self.axes:
+            if speed and (phase + speed * time) % (2 * span) >= span:
+                speed = -speed
+            result.append(speed)
+        return result[0], result[1]
+
+
+def _fold(low: float, span: float, phase: float) -> float:
+    """##Onde triangulaire entre `low` et `low + span`."""
+    if not span:
+        return low
+    phase %= 2 * span
+    return low + (phase if phase <= span else 2 * span - phase)
+
+
+def layout_of(world: World) -> Layout:
+    """##Retourne la disposition des ennemis d'une partie."""
+    return tuple(
+        (body.x, body.y, body.hw, body.hh, body.vx, body.vy)
+        for body in world.enemies
+    )
+
+
+@lru_cache(maxsize=8)
+def trajectories(
+        layout: Layout, width: float, height: float
+) -> tuple[Trajectory, ...]:
+    """##Retourne les trajectoires d'une disposition d'ennemis.
+
+    Le résultat est mis en cache : les parties qui utilisent la même
+    disposition (`config["Enemies"]`) et la même arène partagent leurs
+    trajectoires.
+    """
+    return tuple(
+        Trajectory(x, y, hw, hh, vx, vy, width, height)
+        for x, y, hw, hh, vx, vy in layout
+    )
+
+
+class KineticSimulation:
+    """#Simulation par événements d'une partie.
+
+    La simulation part de l'état courant de `world`. Les positions sont
+    données par les trajectoires en forme close, alors que les contacts
+    sont prédits par segments : chaque segment est une origine (`t0`,
+    `x0`, `y0`) et une vitesse. Les événements périmés dans la file sont
+    reconnus grâce à un numéro de version et ignorés.
+
+    Attributs:
+        - world: Partie simulée. Ses ennemis ne sont mis à jour que par
+          `sync`.
+        - trajectories: Trajectoires des ennemis depuis `origin`.
+        - origin: Temps de départ des trajectoires.
+        - time: Temps courant de la simulation, en ticks.
+        - contact_time: Temps du contact avec le joueur, ou None.
+        - events: Nombre d'événements traités.
+        """
+    def __init__(self, world: World, time: float = 0.0):
+        """"""
+        self.world = world
+        self.time = time
+        self.contact_time: float | None = None
+        self.events = 0
+        self._queue: list[tuple[float, int, int, int, int]] = []
+        self._segments: list[list[float]] = []
+        self._version = [0] * len(world.enemies)
+        self._player_version = 0
+        self._bounds = (world.width, world.height)
+        self._player = (world.player.x, world.player.y)
+        self._half = [(body.hw, body.hh) for body in world.enemies]
+        self._start(time)
+
+    def _start(self, time: float) -> None:
+        """##Recommence les trajectoires et les segments à `time`."""
+        self.origin = time
+        self.trajectories = trajectories(layout_of(self.world), *self._bounds)
+        self._segments = [
+            [time, *path.position(0), *path.velocity(0)]
+            for path in self.trajectories
+        ]
+        # Périme les événements des anciens segments
+        self._version = [version + 1 for version in self._version]
+        for index in range(len(self._segments)):
+            self._schedule(index)
+
+    def position(self, index: int, time: float) -> tuple[float, float]:
+        """##Retourne le centre d'un ennemi, en forme close.
+
+        Args:
+            - index: Indice de l'ennemi.
+            - time: N'importe quel temps après `origin`, ce qui permet
+              de se déplacer librement dans la partie.
+        """
+        return self.trajectories[index].position(time - self.origin)
+
+    def advance(self, time: float) -> bool:
+        """##Traite tous les événements jusqu'à `time`.
+
+        Les déplacements du joueur depuis le dernier appel sont pris en
+        compte.
+
+        Returns:
+            - True si un ennemi a touché le joueur, False sinon.
+        """
+        if self.contact_time is not None:
+            return True
+        player = self.world.player
+        if self._player != (player.x, player.y):
+            self._player = (player.x, player.y)
+            self._player_version += 1
+            for index in range(len(self._segments)):
+                self._schedule_contact(index)
+
+        queue = self._queue
+        while queue and queue[0][0] <= time:
+            when, kind, index, version, player_version = heapq.heappop(queue)
+            if version != self._version[index]:
+                continue
+            if kind == _CONTACT:
+                if player_version != self._player_version:
+                    continue
+                self.events += 1
+                self.time = self.contact_time = when
+                self.world.ticks = int(when)
+                return True
+            self.events += 1
+            self._bounce(index, kind, when)
+
+        self.time = time
+        self.world.ticks = int(time)
+        return False
+
+    def run(self, limit: float = math.inf) -> float | None:
+        """##Avance sans afficher jusqu'au contact avec le joueur.
+
+        Args:
+            - limit: Temps maximal à simuler.
+
+        Returns:
+            - Le temps du contact, ou None si le joueur survit jusqu'à
+              `limit` ou si aucun contact n'est possible.
+        """
+        while self._queue and self.contact_time is None:
+            when = self._queue[0][0]
+            if when > limit:
+                break
+            self.advance(when)
+        if self.contact_time is None and limit != math.inf:
+            self.advance(limit)
+        return self.contact_time
+
+    def sync(self, time: float | None = None) -> None:
+        """##Écrit les positions au temps donné dans `world.enemies`.
+
+        À n'appeler qu'avant d'afficher : c'est la seule opération dont
+        le coût est proportionnel au nombre d'ennemis.
+        """
+        if time is None:
+            time = self.time
+        elapsed = time - self.origin
+        self.world.enemies.place([
+            (*path.position(elapsed), *path.velocity(elapsed))
+            for path in self.trajectories
+        ])
+
+    def restart(self) -> None:
+        """##Recommence toutes les trajectoires au temps courant, depuis
+        l'état de `world`.
+
+        À appeler après avoir changé la vitesse des ennemis de `world`
+        (voir `world.World.set_speeds`), elle-même précédée de `sync`
+        pour que les positions soient à jour.
+        """
+        self._bounds = (self.world.width, self.world.height)
+        self._start(self.time)
+
+    def _bounce(self, index: int, kind: int, when: float) -> None:
+        """##Commence un nouveau segment après un rebond sur un mur."""
+        segment = self._segments[index]
+        x, y = self.position(index, when)
+        hw, hh = self._half[index]
+        width, height = self._bounds
+        # Replace l'ennemi exactement sur le mur pour éviter la dérive
+        if kind == _WALL_X:
+            x = width - hw if segment[3] > 0 else hw
+            segment[3] = -segment[3]
+        else:
+            y = height - hh if segment[4] > 0 else hh
+            segment[4] = -segment[4]
+        segment[0:3] = when, x, y
+        self._version[index] += 1
+        self._schedule(index)
+
+    def _wall_time(self, index: int, axis: int) -> float:
+        """##Temps du prochain rebond d'un ennemi sur un axe."""
+        segment = self._segments[index]
+        start, speed = segment[1 + axis], segment[3 + axis]
+        half = self._half[index][axis]
+        low, high = half, self._bounds[axis] - half
+        if speed == 0 or high <= low:
+            return math.inf
+        wall = high if speed > 0 else low
+        return segment[0] + max(0.0, (wall - start) / speed)
+
+    def _schedule(self, index: int) -> None:
+        """##Planifie les rebonds et le contact du segment courant."""
+        version = self._version[index]
+        for kind, axis in ((_WALL_X, 0), (_WALL_Y, 1)):
+            when = self._wall_time(index, axis)
+            if when != math.inf:
+                heapq.heappush(self._queue, (when, kind, index, version, 0))
+        self._schedule_contact(index)
+
+    def _schedule_contact(self, index: int) -> None:
+        """##Planifie le premier contact avec le joueur, s'il a lieu
+        avant la fin du segment courant."""
+        t0, x0, y0, vx, vy = self._segments[index]
+        hw, hh = self._half[index]
+        player = self.world.player
+        start = max(t0, self.time)
+        end = min(self._wall_time(index, 0), self._wall_time(index, 1))
+        for origin, speed, target, reach in (
+                (x0, vx, player.x, hw + player.hw),
+                (y0, vy, player.y, hh + player.hh),
+        ):
+            # Intervalle où |origin + speed*(t - t0) - target| <= reach
+            if speed == 0:
+                if abs(origin - target) > reach:
+                    return
+                continue
+            t_in = t0 + (target - reach - origin) / speed
+            t_out = t0 + (target + reach - origin) / speed
+            if t_in > t_out:
+                t_in, t_out = t_out, t_in
+            start, end = max(start, t_in), min(end, t_out)
+        if start <= end and start != math.inf:
+            heapq.heappush(self._queue, (
+                start, _CONTACT, index,
+                self._version[index], self._player_version,
+            ))
+
+
+def test_kinetic_contact():
+    world = World(100, 100)
+    world.player.hw = world.player.hh = 5
+    world.player.moveto(80, 50)
+    world.enemies.add(20, 50, 10, 10, 2, 0)
+
+    # Contact quand 20 + 2t + 5 = 75, soit t = 25
+    simulation = KineticSimulation(world)
+    assert not simulation.advance(24.5)
+    assert simulation.advance(30)
+    assert simulation.contact_time == 25
+
+    # Le joueur s'écarte : l'ennemi rebondit sur le mur droit à t = 37.5
+    world = World(100, 100)
+    world.player.hw = world.player.hh = 5
+    world.player.moveto(50, 10)
+    world.enemies.add(20, 50, 10, 10, 2, 0)
+    simulation = KineticSimulation(world)
+    assert not simulation.advance(40)
+    simulation.sync()
+    assert world.enemies[0].x == 95 - 2 * 2.5
+    assert world.enemies[0].vx == -2
+    assert simulation.run(1000) is None
+
+    # Vitesse changée en cours de partie, depuis la position courante
+    world = World(100, 100)
+    world.player.hw = world.player.hh = 5
+    world.player.moveto(50, 10)
+    world.enemies.add(20, 50, 10, 10, 2, 0)
+    simulation = KineticSimulation(world)
+    assert not simulation.advance(10)
+    simulation.sync()
+    world.set_speeds([(4, 0)])
+    simulation.restart()
+    assert not simulation.advance(15)
+    simulation.sync()
+    assert world.enemies[0].x == 40 + 4 * 5
+
+
+def test_trajectory_period():
+    # Amplitude 80, vitesse 2 en x et 4 en y : périodes de 80 et 40
+    path = Trajectory(20, 50, 10, 10, 2, -4, 100, 100)
+    assert path.position(0) == (20, 50)
+    assert path.position(5) == (30, 30)
+    assert path.position(15) == (50, 10 + 10 * 4 - 20)
+    assert path.position(80 * 1000 + 5) == path.position(5)
+    assert path.velocity(15) == (2, 4)
+
+    world = World(100, 100)
+    world.enemies.add(20, 50, 20, 20, 2, -4)
+    layout = layout_of(world)
+    assert trajectories(layout, 100, 100) is trajectories(layout, 100, 100)
+
+
+if __name__ == "__main__":
+    test_kinetic_contact()
+    test_trajectory_period()
+    print("All test passed")
@@ -0,0 +1,77 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""#Module d'importation paresseuse.
+
+Fonction:
+    - lazy_import: Importe un module au premier accès à un attribut.
+
+Notes:
+    - Le menu s'affiche sans charger le jeu (NumPy, simulation) ni les
+      highscores (sqlite3) : ces modules sont chargés à leur première
+      utilisation.
+"""
+# Documentation
+from __future__ import annotations
+from types import ModuleType
+
+# Modules standards
+import importlib.util
+import sys
+
+__docformat__ = "google"
+
+
+def lazy_import(name: str) -> ModuleType:
+    """##Retourne un module dont l'exécution est reportée au premier
+    accès à un de ses attributs.
+
+    Args:
+        - name: Nom absolu du module.
+
+    Raises:
+        - ModuleNotFoundError: Si le module est introuvable. Seule la
+          recherche du fichier est faite immédiatement.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def test_lazy_import():
+    name = "telemetry"
+    sys.modules.pop(name, None)
+    module = lazy_import(name)
+    assert "PATH" not in object.__getattribute__(module, "__dict__")
+    assert module.PATH.endswith("telemetry.jsonl")
+    assert lazy_import(name) is module
+
+
+if __name__ == "__main__":
+    test_lazy_import()
+    print("All test passed")
@@ -24,22 +24,24 @@ Classes:
     - Player: Classe du joueur.
     - Enemy: Classe des ennemis.
     - Score: Classe du score.
-
-Fonction:
-    - collider: Vérifie une collision entre deux objets.
+    - SpriteBatch: Affichage groupé des ennemis.
 """
 # Documentation
 from __future__ import annotations
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
 # Modules standards
-from functools import partial
 from enum import Enum
+from time import monotonic_ns
 import tkinter as tk
 
 # Modules de projet
-import c31Geometry.c31Geometry2 as geo  # type: ignore
 from config import Config
+from geometry import Vec2, ViewTransform
+
+if TYPE_CHECKING:
+    from settings import Settings
+    from world import Body, EnemyStore, World
 
 __docformat__ = "google"
 
@@ -56,51 +58,77 @@ class RectSprite:
 
     Attributs:
         - canvas: Canvas où est dessiné l'objet.
-        - pos_middle: Position du centre de l'objet.
-        - height: Hauteur.
-        - width: Largeur.
+        - body: Boîte de l'entité dans la simulation (`world.Body`).
+        - sprite: Rectangle de l'entité.
         - p1: Coin supérieur gauche ↖ du rectangle.
         - p2: Coin inférieur droit ↘ du rectangle.
-        - sprite: Rectangle de l'entité.
+        - pos_middle: Position du centre de l'objet.
+        - transform: Passage des coordonnées de l'arène au canvas.
 
     Notes:
+        - La position fait autorité dans `body`. Le canvas ne fait que
+          la refléter lors de l'appel à `redraw`.
+        - `p1`, `p2` et `pos_middle` sont en coordonnées de l'arène.
         - Les attributs `p1` et `p2` sont des points, et non des vecteurs.
         """
 
     def __init__(
             self, canvas: tk.Canvas,
-            pos: geo.Point,
-            width: float,
-            height: float,
+            body: Body,
             color: str,
+            transform: ViewTransform | None = None,
     ):
         """"""
         self.canvas = canvas
-        self.pos_middle = pos
-        self.height = height
-        self.width = width
-
-        halfsize = geo.Vecteur(width, height) / 2
-        self.p1 = pos - halfsize
-        "Coin supérieur gauche ↖ du rectangle."
-        self.p2 = pos + halfsize
-        "Coin inférieur droit ↘ du rectangle."
+        self.body = body
+        self.transform = transform if transform is not None else ViewTransform()
+        # Mis à jour sur place par `redraw`, sans nouvelle allocation
+        self.p1, self.p2, self.pos_middle = Vec2(), Vec2(), Vec2()
+        body.corners(self.p1, self.p2)
+        self.pos_middle.set(body.x, body.y)
 
         # Crée le rectangle de l'entité.
-        self.sprite = canvas.create_rectangle(*self.p1, *self.p2, fill=color)
+        self.sprite = canvas.create_rectangle(
+            *self.transform.box(*self.p1, *self.p2), fill=color
+        )
+
+    def attach(self, body: Body) -> None:
+        """##Associe le sprite à une autre boîte, sans recréer son
+        rectangle."""
+        self.body = body
+        self.redraw()
+
+    @property
+    def width(self) -> float:
+        """Largeur."""
+        return self.body.width
+
+    @property
+    def height(self) -> float:
+        """Hauteur."""
+        return self.body.height
 
-    def update_pos(self) -> None:
-        """##Met à jour les attributs de position de l'objet.
+    def redraw(self) -> None:
+        """##Reflète la position de la simulation sur le canvas.
 
         Notes:
-            - Cette méthode est appelée à chaque fois que l'objet est déplacé.
-            - Les attributs `p1` et `p2` sont des points, et non des vecteurs.
-            - Ne deplace pas l'objet sur le canvas, que les points.
+            - Le canvas n'est jamais relu : la synchronisation se fait
+              dans un seul sens, de `body` vers le canvas.
+            - Les attributs `p1`, `p2` et `pos_middle` sont modifiés sur
+              place.
         """
-        coords = self.canvas.coords(self.sprite)
-        self.p1, self.p2 = geo.Point(*coords[:2]), geo.Point(*coords[2:])
-        # Centre: Coin ↖ plus la moitié du vecteur entre les deux coins
-        self.pos_middle = self.p1 + (self.p2 - self.p1) / 2
+        body, p1, p2 = self.body, self.p1, self.p2
+        body.corners(p1, p2)
+        self.pos_middle.set(body.x, body.y)
+        t = self.transform
+        if t.identity:
+            self.canvas.coords(self.sprite, p1.x, p1.y, p2.x, p2.y)
+        else:
+            s = t.scale
+            self.canvas.coords(
+                self.sprite,
+                p1.x * s + t.x, p1.y * s + t.y, p2.x * s + t.x, p2.y * s + t.y,
+            )
 
 
 class Enemy(RectSprite):
@@ -108,57 +136,75 @@ class Enemy(RectSprite):
 
     Attributs:
         - canvas: Canvas où est dessiné l'objet.
-        - pos : Position du  de l'objet.
-        - width: Largeur.
-        - height: Hauteur.
-        - speed: Vecteur de vitesse.
-        - color: Couleur.
-        - player: Référence vers le joueur.
+        - body: Boîte de l'ennemi, qui porte aussi sa vitesse.
+        - color: Couleur. Par défaut, celle de `settings`.
+        - settings: Paramètres figés de la partie. Par défaut, la
+          configuration courante est lue.
 
     Note:
-        - Les attributs `p1` et `p2` sont des points, et non des vecteurs.
+        - Le déplacement est fait par `world.World.advance`.
         """
 
     def __init__(
             self, canvas: tk.Canvas,
-            pos: geo.Point,
-            width: float,
-            height: float,
-            speed: geo.Vecteur,
+            body: Body,
             *, # Prochains sont keyword-only
             color: str | None = None,
-            player: Player,
+            transform: ViewTransform | None = None,
+            settings: Settings | None = None,
     ):
         """"""
-        colordefault = Config.get_instance()["Enemy"]["Color"]["Fill"]
-        _color = color if color is not None else colordefault
+        if color is None:
+            color = (
+                settings.enemy.fill if settings is not None
+                else Config.get_instance().get("Enemy.Color.Fill")
+            )
 
-        super().__init__(canvas, pos, width, height, _color)
-        self.speed = speed
-        self.player = player
+        super().__init__(canvas, body, color, transform)
 
-    def start_move(self) -> None:
-        """##La logique du déplacement des ennemis.
 
-        Note:
-            - Collider sert à détecter les collisions avec le joueur.
-            """
-        # Bouge le rectangle dans la direction indiquée.
-        self.canvas.move(self.sprite, *self.speed)
-        self.update_pos()
+class SpriteBatch:
+    """#Reflète toutes les positions d'un ensemble d'ennemis en un seul
+    appel à Tcl.
 
-        # Dimensions du canvas.
-        cheight = self.canvas.winfo_height()
-        cwidth = self.canvas.winfo_width()
+    Appeler `RectSprite.redraw` pour chaque ennemi traverse la frontière
+    entre Python et Tcl une fois par ennemi. Ici, les commandes `coords`
+    de toute l'image sont réunies dans un seul script, évalué d'un coup
+    après la mise à jour de la simulation.
 
-        # Si l'objet touche à un mur, il change de direction.
-        if not 0 < self.p1.y < self.p2.y < cheight:
-            self.speed = self.speed.conjugate()
-        if not 0 < self.p1.x < self.p2.x < cwidth:
-            self.speed = -self.speed.conjugate()
+    Attributs:
+        - canvas: Canvas où sont dessinés les ennemis.
+        - store: Ensemble des ennemis de la simulation.
+        - sprites: Rectangles des ennemis, dans l'ordre de `store`.
+        - transform: Passage des coordonnées de l'arène au canvas.
 
-        self.canvas.after(20, self.start_move)
-        collider(self.player, self)
+    Note:
+        - Les attributs `p1`, `p2` et `pos_middle` des sprites ne sont
+          pas mis à jour : seul le canvas l'est.
+        """
+    def __init__(
+            self, canvas: tk.Canvas,
+            store: EnemyStore,
+            sprites: list[int],
+            transform: ViewTransform | None = None,
+    ):
+        """"""
+        self.canvas = canvas
+        self.store = store
+        self.sprites = sprites
+        self.transform = transform if transform is not None else ViewTransform()
+        # Seules les coordonnées changent d'une image à l'autre
+        self._commands = [f"{canvas} coords {item} " for item in sprites]
+
+    def redraw(self) -> None:
+        """##Reflète les positions de `store` sur le canvas."""
+        boxes = self.store.boxes()
+        if not self.transform.identity:
+            boxes = [self.transform.box(*box) for box in boxes]
+        self.canvas.tk.eval("\n".join([
+            command + "%r %r %r %r" % box
+            for command, box in zip(self._commands, boxes)
+        ]))
 
 
 class Player(RectSprite):
@@ -166,158 +212,186 @@ class Player(RectSprite):
 
     Attributs:
         - canvas: Canvas où est dessiné l'objet.
-        - bounds: Limites du canvas.
-        - width: Largeur.
-        - height: Hauteur.
+        - world: Simulation de la partie.
+        - border: Taille de la bordure.
         - color: Couleur.
         - timer_widget: Widget du timer.
         - endgame : Fonction à appeler à la fin de la partie.
+        - target: Dernière position demandée, pas encore appliquée.
+        - events: Nombre d'événements de déplacement reçus.
         - score: Score du joueur.
+        - settings: Paramètres figés de la partie. Par défaut, la
+          configuration courante est lue.
         """
     def __init__(
             self, canvas: tk.Canvas,
-            border: float | None = None,
-            width: float | None = None,
-            height: float | None = None,
+            world: World,
             color: str | None = None,
             *,  # Prochains sont keyword-only
             timer_widget : tk.Label,
-            endgame: Callable
+            endgame: Callable,
+            transform: ViewTransform | None = None,
+            settings: Settings | None = None,
         ):
         """"""
-        config = Config.get_instance()
-        def if_given(value, default):
-            return value if value is not None else default
-
-        _border = if_given(border, config["Game"]["Size"]["Border"])
-        _width = if_given(width, config["Player"]["Size"]["Width"])
-        _height = if_given(height, config["Player"]["Size"]["Height"])
-        _color = if_given(color, config["Player"]["Color"]["Fill"])
-        
-        self.endgame = endgame
-        cwidth, cheight = canvas.winfo_width(), canvas.winfo_height()
-        pos = geo.Point(cwidth / 2, cheight / 2)
+        if settings is not None:
+            fill, outline = settings.player.fill, settings.game.outline
+        else:
+            config = Config.get_instance()
+            fill = config.get("Player.Color.Fill")
+            outline = config.get("Game.Color.Outline")
+        _color = color if color is not None else fill
 
-        # Les arguments sont optionels, mais des valeurs sont ajoutées
-        super().__init__(canvas, pos, _width, _height, _color)
-        self.border = _border
+        self.endgame = endgame
+        self.target: tuple[float, float] | None = None
+        self.events = 0
+        self.world = world
+        super().__init__(canvas, world.player, _color, transform)
+        self.border = world.border
         self.score = Score(canvas, timer_widget)
 
-        # Affichage de la bordure
-        rect = self.canvas.create_rectangle(
-            0, 0,
-            canvas.winfo_width(), canvas.winfo_height(),
-            outline=config["Game"]["Color"]["Outline"],
-            width=_border * 2,
+        # Affichage de la bordure, autour de l'arène et non du canvas
+        self.border_rect = self.canvas.create_rectangle(
+            0, 0, 0, 0, outline=outline,
         )
-        self.canvas.lower(rect)
+        self.canvas.lower(self.border_rect)
+        self.draw_border()
 
         #  Lorsque le joueur clique sur le carre rouge fonction move().
         canvas.tag_bind(self.sprite, "<B1-Motion>", self._move)
 
-    def wall_collision(self, bordersize: float = None) -> bool:
-        """##Détecte une collision avec les murs.
+    def reset(self, world: World, settings: Settings | None = None) -> None:
+        """##Prépare le joueur pour une nouvelle partie.
 
-        Args:
-            - bordersize: Taille de la bordure.
-
-        Returns:
-            - True si il y a collision, False sinon.
-            """
-        if bordersize is None:
-            bordersize = self.border
-
-        self.update_pos()
-
-        #  Dimensions du canvas.
-        cheight = self.canvas.winfo_height() - bordersize
-        cwidth = self.canvas.winfo_width() - bordersize
-
-        # Détecte la collision.
-        return (not bordersize < self.p1.y < self.p2.y < cheight
-                or not bordersize < self.p1.x < self.p2.x < cwidth)
-
-    def _move(self, event: tk.Event) -> None:
-        """##Permet au joueur de se déplacer
+        Le rectangle, la bordure et le label du score sont gardés : seul
+        l'état de la partie est remplacé.
 
         Args:
-            - event: Événement de déplacement.
+            - world: Simulation de la nouvelle partie.
+            - settings: Paramètres figés de la nouvelle partie. Si donnés,
+              les couleurs du joueur et de la bordure sont mises à jour.
         """
-        #  Arrête le déplacement si le joueur touche un mur.
-        if not self.wall_collision():
-            self.canvas.moveto(
-                self.sprite,
-                event.x - self.width/2,
-                event.y - self.height/2
+        if settings is not None:
+            self.canvas.itemconfigure(self.sprite, fill=settings.player.fill)
+            self.canvas.itemconfigure(
+                self.border_rect, outline=settings.game.outline
             )
-        else:
-            self.endgame()
+        self.world = world
+        self.border = world.border
+        self.target = None
+        self.events = 0
+        self.score = Score(self.canvas, self.score.label)
+        self.score.label.config(text=self.score)
+        self.attach(world.player)
+        self.draw_border()
+
+    def draw_border(self) -> None:
+        """##Place la bordure autour de l'arène, à l'échelle du canvas."""
+        self.canvas.coords(
+            self.border_rect,
+            *self.transform.box(0, 0, self.world.width, self.world.height),
+        )
+        self.canvas.itemconfigure(
+            self.border_rect, width=self.border * 2 * self.transform.scale
+        )
 
+    def _move(self, event: tk.Event) -> None:
+        """##Retient la position demandée par le joueur.
 
-def collider(object1: RectSprite | Player, object2: RectSprite) -> bool:
-    """##Vérifie une collision entre deux objets.
+        Une souris rapide envoie bien plus d'événements que de ticks :
+        seule la dernière position est gardée, et la boucle de jeu
+        l'applique une fois par tick (voir `take_target`).
 
-    Args:
-        - object1: Premier objet.
-        - object2: Deuxième objet.
+        Args:
+            - event: Événement de déplacement, en coordonnées du canvas.
+        """
+        self.target = self.transform.to_world(event.x, event.y)
+        self.events += 1
 
-    Note:
-        - Si un des objets est le joueur, il doit être le premier argument.
+    def take_target(self) -> tuple[float, float] | None:
+        """##Retourne la position demandée depuis le dernier appel.
 
-    Returns:
-        - True si il y a collision, False sinon.
-    """
-    overlaps = object1.canvas.find_overlapping(*object1.p1, *object1.p2)
-    ret =  object2.sprite in overlaps
-    if ret and isinstance(object1, Player):
-        object1.endgame()
-    return ret
+        Returns:
+            - La dernière position demandée, ou None si le joueur n'a
+              pas bougé.
+        """
+        target, self.target = self.target, None
+        return target
 
 
 class Score:
     """#Contrôle l'état du score
 
+    Le score est le temps écoulé entre `start` et `stop`, mesuré avec
+    une horloge monotone. Il ne dépend donc pas de la ponctualité des
+    rappels de Tk.
+
     Attributs:
         - canvas: Canvas où est dessiné l'objet.
         - label: Label du score.
-        - value: Valeur du score.
+        - value: Valeur du score, en millisecondes.
         - started: Booléen indiquant si le timer est lancé.
-        - loop: Boucle du timer.
+        - excluded: Temps retiré du score, en millisecondes : celui
+          pendant lequel le jeu n'a pas avancé (voir
+          `gameloop.GameLoop.dropped`).
         """
     def __init__(self, canvas: tk.Canvas, label: tk.Label):
         """"""
-        self.value = 0
         self.started = False
         self.canvas = canvas
         self.label = label
+        self.excluded = 0
+        self._start = 0
+        self._end: int | None = None
+        self._shown = 0
+
+    @property
+    def value(self) -> int:
+        """Temps écoulé depuis `start`, en millisecondes."""
+        if not self.started:
+            return 0
+        end = self._end if self._end is not None else monotonic_ns()
+        return max(0, (end - self._start) // 1_000_000 - self.excluded)
 
-    def start(self):
+    def start(self) -> None:
         """##Démarre le timer."""
-        if not self.started:
-            def update(self: Score):
-                self.value += 1
-                self.label.config(text=self)
-            self.loop = geo.LoopEvent(
-                self.canvas, partial(update, self),
-                1000,
-            )
-            self.loop.start()
-        else:
+        if self.started:
             raise RuntimeError("Started score twice")
-    
+        self.started = True
+        self._start = monotonic_ns()
+
+    def stop(self) -> None:
+        """##Arrête le timer. Le score ne change plus ensuite."""
+        if self._end is None:
+            self._end = monotonic_ns()
+
+    def refresh(self) -> None:
+        """##Met à jour le label, seulement si son texte change.
+
+        Appelée à chaque rendu plutôt que par une boucle dédiée.
+        """
+        seconds = self.value // 1000
+        if seconds != self._shown:
+            self._shown = seconds
+            self.label.config(text=self)
+
     @staticmethod
-    def to_readable(value: int) -> str:
-        """##Convertit un nombre de secondes en une chaîne de caractères lisible.
+    def to_readable(value: int, precise: bool = False) -> str:
+        """##Convertit un nombre de millisecondes en une chaîne de
+        caractères lisible.
 
         Args:
-            - value: Nombre de secondes.
+            - value: Nombre de millisecondes.
+            - precise: Afficher aussi les millisecondes.
 
         Returns:
             - Chaîne de caractères lisible.
         """
-        minutes, seconds = divmod(value, 60)
+        seconds, milliseconds = divmod(value, 1000)
+        minutes, seconds = divmod(seconds, 60)
+        if precise:
+            return f"{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
         return f"{minutes:02d}:{seconds:02d}"
-        return f'{int(value / 60):02}:{int(value % 60):02}'
 
     def __str__(self) -> str:
         return Score.to_readable(self.value)
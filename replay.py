@@ -0,0 +1,362 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""#Module d'enregistrement et de rejeu des parties.
+
+Une partie est entièrement déterminée par sa configuration, la taille
+de l'arène et les entrées du joueur. Chaque entrée est enregistrée avec
+le nombre de ticks écoulés au moment où elle est reçue : la rejouer
+avant le tick suivant reproduit exactement la partie, sans affichage et
+bien plus vite qu'en temps réel.
+
+Classes:
+    - Recorder: Enregistre les entrées d'une partie.
+    - ReplayWriter: Écriture différée des enregistrements.
+    - Outcome: Résultat d'une partie rejouée.
+
+Fonctions:
+    - get_writer: Écrivain partagé par tout le programme.
+    - load: Charge un enregistrement.
+    - simulate: Rejoue un enregistrement sans affichage.
+    - verify: Vérifie le score déclaré par un enregistrement.
+
+Exemple:
+    python replay.py Data/Replays/2022-12-01_14-03-22.json
+"""
+# Documentation
+from __future__ import annotations
+from typing import Any, NamedTuple
+
+# Modules standards
+from datetime import datetime
+import copy
+import json
+import math
+import os
+import sys
+
+# Modules de projet
+from background import BackgroundWriter, shared
+from config import Config, deep_get
+from kinetic import KineticSimulation, SimulationMode
+from world import World
+
+__docformat__ = "google"
+
+FORMAT = 2
+"""Version du format des enregistrements."""
+
+DIRECTORY = os.path.join(os.path.dirname(__file__), "Data", "Replays")
+"""Dossier où sont écrits les enregistrements."""
+
+_MOVE = "move"
+
+
+class Recorder:
+    """#Enregistre les entrées d'une partie.
+
+    Attributs:
+        - header: Configuration et dimensions de l'arène au départ.
+        - events: Entrées `[tick, type, x, y]`, dans l'ordre de réception.
+        """
+    def __init__(self, config: Config | dict, width: float, height: float):
+        """"""
+        settings = config.config if isinstance(config, Config) else config
+        self.header: dict[str, Any] = {
+            "format": FORMAT,
+            "config": copy.deepcopy(settings),
+            "width": width,
+            "height": height,
+        }
+        self.events: list[list] = []
+
+    def move(self, tick: int, x: float, y: float) -> None:
+        """##Enregistre un déplacement du joueur vers (`x`, `y`)."""
+        self.events.append([tick, _MOVE, x, y])
+
+    def save(self, ticks: int, score: int, path: str | None = None) -> str:
+        """##Écrit l'enregistrement d'une partie terminée.
+
+        Args:
+            - ticks: Nombre de ticks exécutés par la partie.
+            - score: Score obtenu, en millisecondes.
+            - path: Fichier à écrire. Par défaut, un nouveau fichier
+              daté dans `DIRECTORY`.
+
+        Returns:
+            - Le chemin du fichier écrit.
+        """
+        if path is None:
+            os.makedirs(DIRECTORY, exist_ok=True)
+            stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S-%f")
+            path = os.path.join(DIRECTORY, stamp + ".json")
+        with open(path, 'w') as file:
+            json.dump(
+                {**self.header, "ticks": ticks, "score": score,
+                 "events": self.events},
+                file,
+            )
+        return path
+
+
+class ReplayWriter(BackgroundWriter):
+    """#Écrit les enregistrements des parties terminées, hors de la
+    boucle de jeu, puis retire les plus anciens pour n'en garder que
+    `keep`.
+
+    Attributs:
+        - directory: Dossier où sont écrits les enregistrements.
+        """
+
+    def __init__(self, directory: str = DIRECTORY):
+        """"""
+        super().__init__("replay")
+        self.directory = directory
+
+    def record(
+            self, recorder: Recorder, ticks: int, score: int, keep: int = 0,
+    ) -> None:
+        """##Ajoute une partie terminée à la file d'écriture.
+
+        `recorder` ne doit plus être modifié.
+
+        Args:
+            - recorder: Enregistrement de la partie.
+            - ticks: Nombre de ticks exécutés par la partie.
+            - score: Score obtenu, en millisecondes.
+            - keep: Nombre d'enregistrements gardés dans `directory`.
+              0 pour tous les garder.
+        """
+        self.put((recorder, ticks, score, keep))
+
+    def write(self, batch: list[tuple[Recorder, int, int, int]]) -> None:
+        """##Écrit un lot de parties terminées."""
+        for recorder, ticks, score, keep in batch:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S-%f")
+                recorder.save(
+                    ticks, score,
+                    os.path.join(self.directory, stamp + ".json"),
+                )
+                if keep > 0:
+                    self._prune(keep)
+            except OSError:
+                pass  # Un replay ne doit jamais arrêter le jeu
+
+    def _prune(self, keep: int) -> None:
+        """##Retire les enregistrements les plus anciens au-delà de
+        `keep`. Les noms datés sont triés dans l'ordre chronologique."""
+        names = sorted(
+            name for name in os.listdir(self.directory)
+            if name.endswith(".json")
+        )
+        for name in names[:-keep]:
+            os.remove(os.path.join(self.directory, name))
+
+
+@shared
+def get_writer() -> ReplayWriter:
+    """##Retourne l'écrivain partagé, fermé à la sortie du programme."""
+    return ReplayWriter()
+
+
+class Outcome(NamedTuple):
+    """#Résultat d'une partie rejouée.
+
+    Attributs:
+        - ticks: Nombre de ticks exécutés avant la fin.
+        - ended: True si la partie s'est terminée par une collision.
+        - score: Score correspondant au nombre de ticks, en
+          millisecondes.
+        """
+    ticks: int
+    ended: bool
+    score: int
+
+
+def load(path: str) -> dict[str, Any]:
+    """##Charge un enregistrement.
+
+    Raises:
+        - ValueError: Si le format du fichier n'est pas supporté.
+    """
+    with open(path) as file:
+        replay = json.load(file)
+    if replay.get("format") != FORMAT:
+        raise ValueError(f"Unsupported replay format: {replay.get('format')}")
+    return replay
+
+
+def simulate(replay: dict[str, Any], limit: int | None = None) -> Outcome:
+    """##Rejoue un enregistrement sans affichage.
+
+    Les entrées reçues après `n` ticks sont appliquées avant le tick
+    `n + 1`, exactement comme pendant la partie. Un déplacement est la
+    position retenue pour un tick (voir `model.Player.take_target`).
+
+    Args:
+        - replay: Enregistrement, tel que retourné par `load`.
+        - limit: Nombre maximal de ticks. Par défaut, le nombre de ticks
+          enregistré.
+    """
+    config = replay["config"]
+    rate = config["Game"]["Loop"]["TickRate"]
+    limit = replay["ticks"] if limit is None else limit
+    steps = deep_get(config, "Game", "Input", "Interpolation") or 1
+    world = World.from_config(config, replay["width"], replay["height"])
+    kinetic = None
+    if SimulationMode[config["Game"]["Simulation"]["Mode"]] \
+            is SimulationMode.KINETIC:
+        kinetic = KineticSimulation(world)
+
+    def outcome(ticks: int, ended: bool) -> Outcome:
+        return Outcome(ticks, ended, math.floor(ticks * 1000 / rate))
+
+    events = replay["events"]
+    index = 0
+    for tick in range(limit + 1):
+        while index < len(events) and events[index][0] <= tick:
+            _, _, x, y = events[index]
+            index += 1
+            if not world.drag_player(x, y, steps):
+                return outcome(tick, True)
+        if tick == limit:
+            break
+        if kinetic is None:
+            collided = world.step()
+        else:
+            collided = kinetic.advance(tick + 1)
+        if collided:
+            return outcome(tick + 1, True)
+    return outcome(limit, False)
+
+
+def verify(replay: dict[str, Any], tolerance: int = 1000) -> bool:
+    """##Vérifie le score déclaré par un enregistrement.
+
+    Le score est mesuré en temps réel pendant la partie, alors que le
+    rejeu le déduit du nombre de ticks. La boucle de jeu rattrape ses
+    retards, mais un score un peu plus haut reste légitime.
+
+    Args:
+        - replay: Enregistrement, tel que retourné par `load`.
+        - tolerance: Écart accepté entre les deux scores, en
+          millisecondes.
+
+    Returns:
+        - True si le rejeu se termine au tick enregistré et que le score
+          déclaré est plausible.
+    """
+    outcome = simulate(replay)
+    return (
+        outcome.ended
+        and outcome.ticks == replay["ticks"]
+        and replay["score"] <= outcome.score + tolerance
+    )
+
+
+def test_replay_roundtrip():
+    import tempfile
+    from gameloop import GameLoop
+
+    class Widget:
+        """Remplace le widget Tk : les rappels sont appelés à la main."""
+        pending = None
+
+        def after(self, delay, callback):
+            self.pending = callback
+            return "after"
+
+        def after_cancel(self, _):
+            self.pending = None
+
+    def play(dx: float) -> dict[str, Any]:
+        """Joue une partie comme `controller.GameController.tick` : le
+        joueur se déplace de `dx` pendant 20 ticks, puis attend."""
+        config = copy.deepcopy(Config.get_instance("defaults").config)
+        width = height = config["Game"]["Size"]["Width"]
+        recorder = Recorder(config, width, height)
+        world = World.from_config(config, width, height)
+        saved = []
+
+        def end(ticks: int) -> None:
+            loop.stop()
+            saved.append(recorder.save(ticks, 0, path))
+
+        def tick() -> None:
+            if loop.ticks < 20:
+                target = (world.player.x + dx, world.player.y)
+                recorder.move(loop.ticks, *target)
+                if not world.drag_player(*target):
+                    end(loop.ticks)
+                    return
+            if world.step():
+                end(loop.ticks + 1)
+
+        widget = Widget()
+        loop = GameLoop(widget, 100_000, tick)
+        loop.start()
+        while loop.running:
+            widget.pending()
+        return load(saved[0])
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "r.json")
+        # Fin par collision avec un ennemi, puis contre la bordure
+        for dx in (1, 30):
+            replay = play(dx)
+            outcome = simulate(replay)
+            assert outcome.ended and outcome.ticks == replay["ticks"]
+            assert verify(replay)
+    replay["score"] = outcome.score + 10_000
+    assert not verify(replay)
+
+
+def test_writer_keeps_latest():
+    import tempfile
+
+    config = Config.get_instance("defaults").config
+    with tempfile.TemporaryDirectory() as directory:
+        writer = ReplayWriter(directory)
+        for score in range(5):
+            writer.record(Recorder(config, 10, 10), 0, score, keep=3)
+            writer.close()  # Noms datés distincts
+        names = sorted(os.listdir(directory))
+        assert len(names) == 3
+        scores = [load(os.path.join(directory, name))["score"]
+                  for name in names]
+        assert scores == [2, 3, 4]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        for path in sys.argv[1:]:
+            replay = load(path)
+            outcome = simulate(replay)
+            verdict = "ok" if verify(replay) else "SUSPICIOUS"
+            print(
+                f"{path}: {outcome.ticks}/{replay['ticks']} ticks,"
+                f" score {replay['score']} (replayed {outcome.score})"
+                f" {verdict}"
+            )
+    else:
+        test_replay_roundtrip()
+        test_writer_keeps_latest()
+        print("All test passed")
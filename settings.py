@@ -0,0 +1,395 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""#Module des paramètres figés d'une partie.
+
+La configuration (`config.Config`) est un dictionnaire imbriqué et
+modifiable. Au début de chaque partie, les valeurs utiles au jeu en sont
+copiées une seule fois dans des objets figés et compacts : les objets
+du jeu lisent ensuite de simples attributs, et une modification de la
+configuration pendant une partie ne touche pas la partie en cours, sauf
+si elle lui est appliquée explicitement (voir `Settings.updated`).
+
+Classes:
+    - GameSettings: Paramètres de la section `Game`.
+    - PlayerSettings: Paramètres de la section `Player`.
+    - EnemySettings: Paramètres de la section `Enemy`.
+    - EnemySpec: Un ennemi de la liste `Enemies`.
+    - Settings: Ensemble des paramètres d'une partie.
+
+Fonctions:
+    - check: Vérifie des nouvelles valeurs avant de les appliquer.
+    - snapshot: Fige la configuration courante.
+"""
+# Documentation
+from __future__ import annotations
+from typing import Any, Mapping
+
+# Modules standards
+from dataclasses import dataclass, fields, replace
+
+# Modules de projet
+from config import Config
+
+__docformat__ = "google"
+
+
+@dataclass(frozen=True, slots=True)
+class GameSettings:
+    """#Paramètres de la section `Game`.
+
+    Attributs:
+        - width: Largeur logique de l'arène.
+        - height: Hauteur logique de l'arène.
+        - border: Épaisseur de la bordure.
+        - fill: Couleur de fond.
+        - outline: Couleur de la bordure.
+        - difficulty: Nom de la difficulté (voir `model.Difficulty`).
+        - tick_rate: Nombre de ticks par seconde.
+        - max_catchup: Nombre maximal de ticks exécutés par rappel.
+        - max_lag: Retard maximal rattrapé, en secondes.
+        - cell_size: Taille des cellules de la grille de collisions.
+        - mode: Nom du mode de simulation (voir `kinetic.SimulationMode`).
+        - interpolation: Nombre de pas d'un déplacement du joueur.
+        - overlay_visible: Affichage initial des performances.
+        - overlay_key: Touche qui affiche ou cache les performances.
+        - overlay_interval: Délai entre deux rafraîchissements des
+          performances, en secondes.
+        - telemetry: Enregistrement de la télémétrie en fin de partie.
+        - record: Enregistrement d'un replay de la partie.
+        - keep_replays: Nombre de replays gardés sur le disque, 0 pour
+          tous les garder.
+        """
+    width: int
+    height: int
+    border: int
+    fill: str
+    outline: str
+    difficulty: str
+    tick_rate: float
+    max_catchup: int
+    max_lag: float
+    cell_size: int
+    mode: str
+    interpolation: int
+    overlay_visible: bool
+    overlay_key: str
+    overlay_interval: float
+    telemetry: bool
+    record: bool
+    keep_replays: int
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerSettings:
+    """#Paramètres de la section `Player`.
+
+    Attributs:
+        - fill: Couleur du joueur.
+        - outline: Couleur du contour.
+        - width: Largeur.
+        - height: Hauteur.
+        - border: Épaisseur du contour.
+        """
+    fill: str
+    outline: str
+    width: int
+    height: int
+    border: int
+
+
+@dataclass(frozen=True, slots=True)
+class EnemySettings:
+    """#Paramètres de la section `Enemy`, communs à tous les ennemis.
+
+    Attributs:
+        - fill: Couleur des ennemis.
+        - outline: Couleur du contour.
+        - border: Épaisseur du contour.
+        """
+    fill: str
+    outline: str
+    border: int
+
+
+@dataclass(frozen=True, slots=True)
+class EnemySpec:
+    """#Un ennemi de la liste `Enemies`, à sa position de départ.
+
+    Attributs:
+        - x: Position horizontale du centre.
+        - y: Position verticale du centre.
+        - width: Largeur.
+        - height: Hauteur.
+        - speed_x: Vitesse horizontale, par tick.
+        - speed_y: Vitesse verticale, par tick.
+        """
+    x: float
+    y: float
+    width: float
+    height: float
+    speed_x: float
+    speed_y: float
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """#Ensemble des paramètres d'une partie.
+
+    Attributs:
+        - game: Paramètres de la section `Game`.
+        - player: Paramètres du joueur.
+        - enemy: Paramètres communs des ennemis.
+        - enemies: Ennemis de départ, dans l'ordre de la configuration.
+        """
+    game: GameSettings
+    player: PlayerSettings
+    enemy: EnemySettings
+    enemies: tuple[EnemySpec, ...]
+
+    @classmethod
+    def from_config(cls, config: Config | Mapping[str, Any]) -> Settings:
+        """##Copie les valeurs d'une configuration complète.
+
+        Args:
+            - config: Configuration, ou son dictionnaire.
+
+        Returns:
+            - Des paramètres indépendants de `config`.
+        """
+        groups: dict[str, dict[str, Any]] = {name: {} for name in _GROUPS}
+        for path, (group, field) in FIELDS.items():
+            value = config
+            for key in path.split("."):
+                value = value[key]
+            groups[group][field] = value
+        return cls(
+            **{
+                name: _GROUPS[name](**values)
+                for name, values in groups.items()
+            },
+            enemies=_enemy_specs(config["Enemies"]),
+        )
+
+    def updated(self, changes: Mapping[str, Any]) -> Settings:
+        """##Retourne une copie des paramètres avec quelques valeurs
+        changées.
+
+        Seuls les groupes touchés sont recréés : le coût est
+        proportionnel au nombre de changements.
+
+        Args:
+            - changes: Nouvelles valeurs par chemin pointé, par exemple
+              `{"Game.Loop.TickRate": 60}`. Les chemins inconnus sont
+              ignorés.
+
+        Raises:
+            - TypeError, ValueError: Voir `check`.
+        """
+        check(changes)
+        groups: dict[str, dict[str, Any]] = {}
+        enemies = self.enemies
+        for path, value in changes.items():
+            if path == "Enemies":
+                enemies = _enemy_specs(value)
+            elif path in FIELDS:
+                group, field = FIELDS[path]
+                groups.setdefault(group, {})[field] = value
+        return replace(
+            self,
+            enemies=enemies,
+            **{
+                name: replace(getattr(self, name), **values)
+                for name, values in groups.items()
+            },
+        )
+
+
+FIELDS: dict[str, tuple[str, str]] = {
+    "Game.Size.Width": ("game", "width"),
+    "Game.Size.Height": ("game", "height"),
+    "Game.Size.Border": ("game", "border"),
+    "Game.Color.Fill": ("game", "fill"),
+    "Game.Color.Outline": ("game", "outline"),
+    "Game.Difficulty.Level": ("game", "difficulty"),
+    "Game.Loop.TickRate": ("game", "tick_rate"),
+    "Game.Loop.MaxCatchup": ("game", "max_catchup"),
+    "Game.Loop.MaxLag": ("game", "max_lag"),
+    "Game.Collision.CellSize": ("game", "cell_size"),
+    "Game.Simulation.Mode": ("game", "mode"),
+    "Game.Input.Interpolation": ("game", "interpolation"),
+    "Game.Overlay.Visible": ("game", "overlay_visible"),
+    "Game.Overlay.Key": ("game", "overlay_key"),
+    "Game.Overlay.Interval": ("game", "overlay_interval"),
+    "Game.Telemetry.Enabled": ("game", "telemetry"),
+    "Game.Replay.Record": ("game", "record"),
+    "Game.Replay.Keep": ("game", "keep_replays"),
+    "Player.Color.Fill": ("player", "fill"),
+    "Player.Color.Outline": ("player", "outline"),
+    "Player.Size.Width": ("player", "width"),
+    "Player.Size.Height": ("player", "height"),
+    "Player.Size.Border": ("player", "border"),
+    "Enemy.Color.Fill": ("enemy", "fill"),
+    "Enemy.Color.Outline": ("enemy", "outline"),
+    "Enemy.Size.Border": ("enemy", "border"),
+}
+"""Chemin pointé de la configuration de chaque paramètre figé, associé
+au groupe (attribut de `Settings`) et au champ qui le reçoivent. La
+liste `Enemies` est traitée à part."""
+
+_GROUPS = {
+    "game": GameSettings,
+    "player": PlayerSettings,
+    "enemy": EnemySettings,
+}
+
+
+_TYPES: dict[str, tuple[type, ...]] = {
+    "int": (int,),
+    "float": (int, float),
+    "str": (str,),
+    "bool": (bool,),
+}
+"""Types acceptés pour chaque annotation des champs."""
+
+_FIELD_TYPES = {
+    path: _TYPES[{
+        field.name: field.type for field in fields(_GROUPS[group])
+    }[name]]
+    for path, (group, name) in FIELDS.items()
+}
+
+_POSITIVE = {
+    "Game.Size.Width", "Game.Size.Height",
+    "Game.Loop.TickRate", "Game.Loop.MaxCatchup", "Game.Loop.MaxLag",
+    "Game.Input.Interpolation", "Game.Overlay.Interval",
+}
+"""Chemins dont la valeur doit être strictement positive."""
+
+
+def _check_type(path: str, value: Any, expected: tuple[type, ...]) -> None:
+    """##Lève `TypeError` si `value` n'est pas d'un type attendu. Un
+    booléen n'est pas accepté comme nombre."""
+    if not isinstance(value, expected) \
+            or (isinstance(value, bool) and bool not in expected):
+        raise TypeError(f"{path}: unexpected value {value!r}")
+
+
+def check(changes: Mapping[str, Any]) -> None:
+    """##Vérifie des nouvelles valeurs avant de les appliquer, par
+    exemple celles d'un fichier modifié à la main.
+
+    Args:
+        - changes: Nouvelles valeurs par chemin pointé. Les chemins
+          inconnus sont ignorés.
+
+    Raises:
+        - TypeError: Si une valeur n'a pas le type de son paramètre.
+        - ValueError: Si une valeur qui doit être positive ne l'est
+          pas, ou si un ennemi de `Enemies` est incomplet.
+    """
+    for path, value in changes.items():
+        if path == "Enemies":
+            _check_type(path, value, (list,))
+            try:
+                specs = _enemy_specs(value)
+            except (KeyError, TypeError) as error:
+                raise ValueError(f"Enemies: invalid enemy ({error})")
+            for spec in specs:
+                for field in fields(spec):
+                    _check_type(
+                        f"Enemies.{field.name}",
+                        getattr(spec, field.name), _TYPES["float"],
+                    )
+        elif path in FIELDS:
+            _check_type(path, value, _FIELD_TYPES[path])
+            if path in _POSITIVE and not value > 0:
+                raise ValueError(f"{path}: must be positive, not {value!r}")
+
+
+def _enemy_specs(enemies: list[dict[str, Any]]) -> tuple[EnemySpec, ...]:
+    """##Fige la liste `Enemies` de la configuration."""
+    return tuple(
+        EnemySpec(
+            spec["Position"]["X"], spec["Position"]["Y"],
+            spec["Size"]["Width"], spec["Size"]["Height"],
+            spec["Speed"]["X"], spec["Speed"]["Y"],
+        )
+        for spec in enemies
+    )
+
+
+def snapshot(name: str = "settings") -> Settings:
+    """##Fige la configuration courante.
+
+    Args:
+        - name: Nom de la configuration (voir `config.Config.get_instance`).
+    """
+    return Settings.from_config(Config.get_instance(name))
+
+
+def test_snapshot():
+    from dataclasses import FrozenInstanceError
+
+    config = Config.get_instance()
+    settings = snapshot()
+    assert settings.game.width == config.get("Game.Size.Width")
+    assert len(settings.enemies) == len(config["Enemies"])
+    assert not hasattr(settings.game, "__dict__")
+
+    try:
+        settings.game.width = 0  # type: ignore
+    except FrozenInstanceError:
+        pass
+    else:
+        raise AssertionError("Settings should be frozen")
+
+    # La configuration peut changer sans toucher les paramètres figés
+    old = config.get("Enemy.Color.Fill")
+    config.set("Enemy.Color.Fill", old + "_")
+    assert settings.enemy.fill == old
+    config.set("Enemy.Color.Fill", old)
+
+    for path in FIELDS:
+        assert config.get(path) is not None, path
+    changed = settings.updated({"Game.Loop.TickRate": 1, "Enemies": []})
+    assert changed.game.tick_rate == 1 and changed.enemies == ()
+    assert changed.player is settings.player
+
+    # Valeurs refusées, par exemple après une erreur de saisie
+    for changes in (
+            {"Enemies": 5},
+            {"Enemies": [{"Size": {}}]},
+            {"Game.Loop.TickRate": 0},
+            {"Game.Color.Fill": 3},
+            {"Game.Size.Width": True},
+    ):
+        try:
+            settings.updated(changes)
+        except (TypeError, ValueError):
+            pass
+        else:
+            raise AssertionError(f"Accepted {changes}")
+    assert settings.updated({"Game.Loop.MaxLag": 2}).game.max_lag == 2
+    assert settings.game.tick_rate == config.get("Game.Loop.TickRate")
+
+
+if __name__ == "__main__":
+    test_snapshot()
+    print("All test passed")
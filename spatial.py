@@ -0,0 +1,120 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""#Module de la phase large de détection des collisions.
+
+Classe:
+    - SpatialHash: Grille uniforme qui range des boîtes par cellule.
+
+Notes:
+    - Une boîte est rangée dans toutes les cellules qu'elle touche. Deux
+      boîtes qui se touchent partagent donc toujours au moins une
+      cellule, ce qui permet de ne tester que les voisins du joueur.
+"""
+# Documentation
+from __future__ import annotations
+
+__docformat__ = "google"
+
+CellRange = tuple[int, int, int, int]
+"""Cellules (cx1, cy1, cx2, cy2) couvertes par une boîte, inclusives."""
+
+
+class SpatialHash:
+    """#Grille uniforme qui range des boîtes par cellule.
+
+    Les appartenances sont mises à jour de façon incrémentale : une
+    boîte qui reste dans les mêmes cellules ne coûte qu'une comparaison.
+    Le coût d'une requête dépend du nombre de boîtes près de la zone
+    demandée, et non du nombre total de boîtes.
+
+    Attributs:
+        - cell_size: Côté d'une cellule, en pixels.
+        - buckets: Clés des boîtes présentes dans chaque cellule.
+        """
+    def __init__(self, cell_size: float):
+        """"""
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self.buckets: dict[tuple[int, int], set[int]] = {}
+
+    def cell_range(
+            self, x1: float, y1: float, x2: float, y2: float
+    ) -> CellRange:
+        """##Retourne les cellules couvertes par une boîte."""
+        size = self.cell_size
+        return int(x1 // size), int(y1 // size), int(x2 // size), int(y2 // size)
+
+    def add(self, key: int, cells: CellRange) -> None:
+        """##Range une boîte dans ses cellules."""
+        cx1, cy1, cx2, cy2 = cells
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                self.buckets.setdefault((cx, cy), set()).add(key)
+
+    def discard(self, key: int, cells: CellRange) -> None:
+        """##Retire une boîte de ses cellules."""
+        cx1, cy1, cx2, cy2 = cells
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                bucket = self.buckets.get((cx, cy))
+                if bucket is not None:
+                    bucket.discard(key)
+                    if not bucket:
+                        del self.buckets[cx, cy]
+
+    def move(self, key: int, old: CellRange, new: CellRange) -> None:
+        """##Change les cellules d'une boîte, si elles ont changé.
+
+        Seules les cellules quittées ou nouvellement touchées sont
+        modifiées, ce qui est le cas courant d'un petit déplacement.
+        """
+        if old == new:
+            return
+        ox1, oy1, ox2, oy2 = old
+        nx1, ny1, nx2, ny2 = new
+        buckets = self.buckets
+        for cx in range(ox1, ox2 + 1):
+            for cy in range(oy1, oy2 + 1):
+                if not (nx1 <= cx <= nx2 and ny1 <= cy <= ny2):
+                    bucket = buckets.get((cx, cy))
+                    if bucket is not None:
+                        bucket.discard(key)
+                        if not bucket:
+                            del buckets[cx, cy]
+        for cx in range(nx1, nx2 + 1):
+            for cy in range(ny1, ny2 + 1):
+                if not (ox1 <= cx <= ox2 and oy1 <= cy <= oy2):
+                    buckets.setdefault((cx, cy), set()).add(key)
+
+    def query(self, cells: CellRange) -> set[int]:
+        """##Retourne les clés des boîtes présentes dans des cellules.
+
+        Le résultat est un sur-ensemble des boîtes qui touchent la zone :
+        un test exact doit encore être fait sur chaque candidat.
+        """
+        found: set[int] = set()
+        cx1, cy1, cx2, cy2 = cells
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                bucket = self.buckets.get((cx, cy))
+                if bucket:
+                    found |= bucket
+        return found
@@ -0,0 +1,118 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""#Module de télémétrie des parties.
+
+Chaque partie terminée ajoute une ligne JSON à un fichier local, pour
+agréger plus tard les performances réelles de plusieurs machines.
+
+Classe:
+    - TelemetryWriter: Écriture différée des enregistrements.
+
+Fonctions:
+    - host_info: Description de la machine.
+    - get_writer: Écrivain partagé par tout le programme.
+
+Notes:
+    - L'écriture se fait en arrière-plan, voir `background`.
+"""
+# Documentation
+from __future__ import annotations
+from typing import Any
+
+# Modules standards
+from functools import cache
+import json
+import os
+import platform
+
+# Modules de projet
+from background import BackgroundWriter, shared
+
+__docformat__ = "google"
+
+PATH = os.path.join(os.path.dirname(__file__), "Data", "telemetry.jsonl")
+"""Fichier où sont ajoutés les enregistrements."""
+
+
+@cache
+def host_info() -> dict[str, Any]:
+    """##Retourne la description de la machine, calculée une seule fois."""
+    import tkinter as tk
+
+    return {
+        "node": platform.node(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+        "tk": tk.TkVersion,
+    }
+
+
+class TelemetryWriter(BackgroundWriter):
+    """#Ajoute des enregistrements à un fichier JSONL, hors de la boucle
+    de jeu.
+
+    Attributs:
+        - path: Fichier où sont ajoutés les enregistrements.
+        """
+
+    def __init__(self, path: str = PATH):
+        """"""
+        super().__init__("telemetry")
+        self.path = path
+
+    def record(self, entry: dict[str, Any]) -> None:
+        """##Ajoute un enregistrement à la file d'écriture."""
+        self.put(entry)
+
+    def write(self, batch: list[dict[str, Any]]) -> None:
+        """##Ajoute un lot d'enregistrements au fichier."""
+        try:
+            with open(self.path, 'a') as file:
+                file.writelines(json.dumps(entry) + "\n" for entry in batch)
+        except OSError:
+            pass  # La télémétrie ne doit jamais arrêter le jeu
+
+
+@shared
+def get_writer() -> TelemetryWriter:
+    """##Retourne l'écrivain partagé, fermé à la sortie du programme."""
+    return TelemetryWriter()
+
+
+def test_writer_appends():
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        writer = TelemetryWriter(os.path.join(directory, "t.jsonl"))
+        for score in range(3):
+            writer.record({"score": score})
+        writer.close()
+        writer.record({"score": 3})
+        writer.close()
+        with open(writer.path) as file:
+            lines = [json.loads(line) for line in file]
+    assert [line["score"] for line in lines] == [0, 1, 2, 3]
+
+
+if __name__ == "__main__":
+    test_writer_appends()
+    print("All test passed")
@@ -41,16 +41,22 @@ from typing import TYPE_CHECKING, Callable
 
 # Modules standards
 from abc import ABC  # Abstract Base Class
-import os.path
+from time import perf_counter
 import tkinter as tk
 from tkinter import PhotoImage
 
 if TYPE_CHECKING:
     from game_engine import Root
+    from gameloop import GameLoop
+    from world import World
 
+import assets
 from model import Score, Difficulty
 from config import Config
-from highscore import HighScore
+from lazy import lazy_import
+
+# Chargé à la première ouverture des highscores, pas au menu
+highscore = lazy_import("highscore")
 
 __docformat__ = "google"
 
@@ -133,34 +139,14 @@ class MenuView(View):
         self.root.title("Jeu du carré rouge - Menu")
         self.root.geometry("450x450")
         
-        currentdir = os.path.dirname(__file__)
-        graphics = os.path.join(currentdir, "Graphics")
-        buttons = os.path.join(graphics, "Buttons")
         # Photos des widgets
-        self.title_photo = PhotoImage(
-            file=os.path.join(graphics, "logo.png")
-        )
-        self.play_photo = PhotoImage(
-            file=os.path.join(buttons, "playButton.png")
-        )
-        self.play_pressed_photo = PhotoImage(
-            file=os.path.join(buttons, "playButtonPressed.png")
-        )
-        self.quit_photo = PhotoImage(
-            file=os.path.join(buttons, "quitButton.png")
-        )
-        self.quit_pressed_photo = PhotoImage(
-            file=os.path.join(buttons, "quitButtonPressed.png")
-        )
-        self.options_photo = PhotoImage(
-            file=os.path.join(buttons, "optionsButton.png")
-        )
-        self.options_photo = PhotoImage(
-            file=os.path.join(buttons, "optionsButton.png")
-        )
-        self.highscores_photo = PhotoImage(
-            file=os.path.join(buttons, "highscoresButton.png")
-        )
+        self.title_photo = assets.image("logo.png")
+        self.play_photo = assets.image("Buttons/playButton.png")
+        self.play_pressed_photo = assets.image("Buttons/playButtonPressed.png")
+        self.quit_photo = assets.image("Buttons/quitButton.png")
+        self.quit_pressed_photo = assets.image("Buttons/quitButtonPressed.png")
+        self.options_photo = assets.image("Buttons/optionsButton.png")
+        self.highscores_photo = assets.image("Buttons/highscoresButton.png")
         
         def create_btn(image: PhotoImage, cmd: Callable) -> tk.Button:
             """##Fonction de création d'un bouton
@@ -226,7 +212,7 @@ class GameView(View):
         - on_quit (Callable): Fonction à appeler lors du clic sur le bouton Quitter"""
     def draw(self):
         """##Fonction appelée pour dessiner le jeu"""
-        self.frame.pack()
+        self.frame.pack(fill=tk.BOTH, expand=True)
 
 
 class HighscoreView(View):
@@ -283,9 +269,9 @@ class HighscoreView(View):
         )
 
         self.callbacks: list[Callable[[], None]] = []
-        for score, callback in HighScore.get_scores():
+        for score, callback in highscore.HighScore.get_scores():
             self.highscore_canvas.listBox.insert(
-                    "end", f"{score[0]} : {Score.to_readable(score[1])}"
+                    "end", f"{score[0]} : {Score.to_readable(score[1], precise=True)}"
             )
             self.callbacks.append(callback)
 
@@ -295,16 +281,8 @@ class HighscoreView(View):
         self.btn_height = size["Height"] / 4.5
         self.btn_width = 2 * self.btn_height
 
-        currentdir = os.path.dirname(__file__)
-        graphics = os.path.join(currentdir, "Graphics")
-        buttons = os.path.join(graphics, "Buttons")
-
-        self.quit_photo = PhotoImage(
-            file=os.path.join(buttons, "quitButton.png")
-        )
-        self.menu_photo = PhotoImage(
-            file=os.path.join(buttons, "menuButton.png")
-        )
+        self.quit_photo = assets.image("Buttons/quitButton.png")
+        self.menu_photo = assets.image("Buttons/menuButton.png")
         # Initialization des boutons
         self.btn_menu = tk.Button(
             self.highscore_canvas,
@@ -401,7 +379,7 @@ class GameEndView(View):
         )
         self.game_over_canvas.create_text(
             225, 70,
-            text="Score :" + str(self.scoreValue),
+            text="Score : " + Score.to_readable(self.scoreValue, precise=True),
             font=("Arial", 15)
         )
 
@@ -419,16 +397,8 @@ class GameEndView(View):
         self.btn_height = size["Height"] / 4.5
         self.btn_width = 2 * self.btn_height
 
-        currentdir = os.path.dirname(__file__)
-        graphics = os.path.join(currentdir, "Graphics")
-        buttons = os.path.join(graphics, "Buttons")
-
-        self.quit_photo = PhotoImage(
-            file=os.path.join(buttons, "quitButton.png")
-        )
-        self.menu_photo = PhotoImage(
-            file=os.path.join(buttons, "menuButton.png")
-        )
+        self.quit_photo = assets.image("Buttons/quitButton.png")
+        self.menu_photo = assets.image("Buttons/menuButton.png")
         # Initialization des boutons
         def create_btn(image: PhotoImage, cmd: Callable) -> tk.Button:
             return tk.Button(
@@ -477,27 +447,12 @@ class OptionsView(View):
         self.diff_height = self.btn_height / 2
         self.diff_width = self.diff_height * 2
 
-
-        currentdir = os.path.dirname(__file__)
-        graphics = os.path.join(currentdir, "Graphics")
-        buttons = os.path.join(graphics, "Buttons")
-
         # Photos des widgets
-        self.quit_photo = PhotoImage(
-            file=os.path.join(buttons, "quitButton.png")
-        )
-        self.menu_photo = PhotoImage(
-            file=os.path.join(buttons, "menuButton.png")
-        )
-        self.easy_photo = PhotoImage(
-            file=os.path.join(buttons, "easyButton.png")
-        )
-        self.medium_photo = PhotoImage(
-            file=os.path.join(buttons, "mediumButton.png")
-        )
-        self.hard_photo = PhotoImage(
-            file=os.path.join(buttons, "hardButton.png")
-        )
+        self.quit_photo = assets.image("Buttons/quitButton.png")
+        self.menu_photo = assets.image("Buttons/menuButton.png")
+        self.easy_photo = assets.image("Buttons/easyButton.png")
+        self.medium_photo = assets.image("Buttons/mediumButton.png")
+        self.hard_photo = assets.image("Buttons/hardButton.png")
 
         # Initialization des boutons
         def create_btn(image: PhotoImage, cmd: Callable) -> tk.Button:
@@ -512,8 +467,8 @@ class OptionsView(View):
         def diff_btn(image: PhotoImage, diff: Difficulty) -> tk.Button:
             def change_diff():
                 config = Config.get_instance()
-                config["Game"]["Difficulty"]["Level"] = diff.name
-                config.save()
+                config.set("Game.Difficulty.Level", diff.name)
+                config.save_later()
             
             return tk.Button(
                     self.options_canvas,
@@ -569,7 +524,7 @@ def create_timer_widget(canvas: tk.Canvas) -> tk.Label:
         text=Score.to_readable(0), width=5, height=1,
         border=0, relief='flat', bg='black', fg='white'
     )
-    label.place(x=225, y=25, anchor="center")
+    label.place(relx=0.5, y=25, anchor="center")
     return label
 
 class GameOverView(View):
@@ -603,17 +558,10 @@ class GameOverView(View):
         self.btn_width = self.btn_height * 2
         
         
-        currentdir = os.path.dirname(__file__)
-        graphics = os.path.join(currentdir, "Graphics")
-        buttons = os.path.join(graphics, "Buttons")
 
         # Photos des widgets
-        self.quit_photo = PhotoImage(
-            file=os.path.join(buttons, "quitButton.png")
-        )
-        self.menu_photo = PhotoImage(
-            file=os.path.join(buttons, "menuButton.png")
-        )
+        self.quit_photo = assets.image("Buttons/quitButton.png")
+        self.menu_photo = assets.image("Buttons/menuButton.png")
         
         # Initialization des boutons
         
@@ -644,3 +592,84 @@ class GameOverView(View):
     
     def draw(self):
         self.frame.pack()
+
+
+class PerformanceOverlay:
+    """#Compteurs de performance affichés par-dessus la partie.
+
+    Le texte est construit à partir des compteurs que la boucle de jeu
+    et la simulation tiennent déjà : l'affichage ne mesure rien
+    lui-même. Il n'est mis à jour que toutes les `interval` secondes, et
+    jamais lorsqu'il est caché.
+
+    Attributs:
+        - canvas: Canvas de la partie.
+        - loop: Boucle de jeu dont les compteurs sont affichés.
+        - world: Simulation de la partie.
+        - interval: Délai entre deux mises à jour, en secondes.
+        - visible: Booléen indiquant si les compteurs sont affichés.
+        - color: Couleur du texte.
+        - item: Texte des compteurs dans le canvas.
+
+    Note:
+        - En mode cinétique, la recherche des contacts fait partie de la
+          durée du tick, et la durée des collisions reste nulle.
+        """
+    def __init__(
+            self, canvas: tk.Canvas,
+            loop: GameLoop,
+            world: World,
+            interval: float = 0.5,
+            visible: bool = False,
+            color: str = "black",
+    ):
+        """"""
+        self.canvas = canvas
+        self.loop = loop
+        self.world = world
+        self.interval = interval
+        self.visible = False
+        self.color = color
+        self.item = canvas.create_text(
+            10, 10, anchor="nw", font=("Courier", 10), state=tk.HIDDEN,
+            fill=color,
+        )
+        self._time = perf_counter()
+        self._frames = 0
+        if visible:
+            self.toggle()
+
+    def toggle(self, _=None) -> None:
+        """##Affiche ou cache les compteurs.
+
+        Args:
+            - _ (tk.Event): L'événement qui a appelé la fonction
+        """
+        self.visible = not self.visible
+        self.canvas.itemconfigure(
+            self.item, state=tk.NORMAL if self.visible else tk.HIDDEN
+        )
+        if self.visible:
+            self.canvas.tag_raise(self.item)
+            self._time, self._frames = perf_counter(), self.loop.frames
+
+    def refresh(self) -> None:
+        """##Met à jour les compteurs si l'intervalle est écoulé."""
+        if not self.visible:
+            return
+        now = perf_counter()
+        elapsed = now - self._time
+        if elapsed < self.interval:
+            return
+        loop = self.loop
+        fps = (loop.frames - self._frames) / elapsed
+        self._time, self._frames = now, loop.frames
+        self.canvas.itemconfigure(self.item, text=(
+            f"FPS       {fps:6.1f}\n"
+            f"tick      {loop.last_duration * 1e3:6.2f} ms\n"
+            f"render    {loop.last_render * 1e3:6.2f} ms\n"
+            f"collision {self.world.collision_time * 1e3:6.2f} ms\n"
+            f"after     {loop.lateness * 1e3:+6.2f} ms\n"
+            f"late {loop.late}  skipped {loop.skipped}"
+            f"  dropped {loop.dropped}"
+        ))
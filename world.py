@@ -0,0 +1,681 @@
+# Copyright (c) 2022 Grainus, WyllasSidjeno, AsadPug, Phil-DB
+# Licence Libre MIT
+
+# L’autorisation est accordée, gracieusement, à toute personne acquérant une copie
+# de ce logiciel et des fichiers de documentation associés (le « logiciel »), de commercialiser
+# le logiciel sans restriction, notamment les droits d’utiliser, de copier, de modifier,
+# de fusionner, de publier, de distribuer, de sous-licencier et / ou de vendre des copies du logiciel,
+# ainsi que d’autoriser les personnes auxquelles la logiciel est fournie à le faire,
+# sous réserve des conditions suivantes :
+#
+# La déclaration de copyright ci-dessus et la présente autorisation doivent être incluses dans
+# toutes copies ou parties substantielles du logiciel.
+#
+# LE LOGICIEL EST FOURNI « TEL QUEL », SANS GARANTIE D’AUCUNE SORTE, EXPLICITE OU IMPLICITE,
+# NOTAMMENT SANS GARANTIE DE QUALITÉ MARCHANDE, D’ADÉQUATION À UN USAGE PARTICULIER ET D’ABSENCE
+# DE CONTREFAÇON. EN AUCUN CAS, LES AUTEURS OU TITULAIRES DU DROIT D’AUTEUR NE SERONT RESPONSABLES
+# DE TOUT DOMMAGE, RÉCLAMATION OU AUTRE RESPONSABILITÉ, QUE CE SOIT DANS LE CADRE D’UN CONTRAT,
+# D’UN DÉLIT OU AUTRE, EN PROVENANCE DE, CONSÉCUTIF À OU EN RELATION AVEC LE LOGICIEL OU SON UTILISATION,
+# OU AVEC D’AUTRES ÉLÉMENTS DU LOGICIEL.
+"""#Module de simulation du jeu, indépendant de Tk.
+
+L'état de la partie (positions, tailles, vitesses et limites) est gardé
+ici en Python pur. Les sprites de `model` ne font que refléter cet état
+sur le canvas, ce qui permet de faire tourner la logique du jeu sans
+affichage.
+
+Classes:
+    - Body: Boîte rectangulaire mobile.
+    - EnemyStore: Ensemble des ennemis, une boîte Python par ennemi.
+    - ArrayEnemyStore: Ensemble des ennemis dans des tableaux NumPy.
+    - World: État complet d'une partie.
+
+Notes:
+    - NumPy est optionnel. S'il est présent, les ennemis sont gardés
+      dans des tableaux contigus et un tick les déplace tous d'un coup.
+    - Les deux ensembles font exactement les mêmes opérations en virgule
+      flottante et donnent donc les mêmes parties.
+    - Si une grille (`spatial.SpatialHash`) est attachée à l'ensemble,
+      seuls les ennemis dans les cellules du joueur sont testés.
+"""
+# Documentation
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+# Modules standards
+from math import copysign
+from time import perf_counter
+
+# Modules optionnels
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from geometry import AABB
+from spatial import SpatialHash
+
+if TYPE_CHECKING:
+    from config import Config
+    from settings import Settings
+
+__docformat__ = "google"
+
+
+class Body(AABB):
+    """#Boîte rectangulaire mobile alignée sur les axes.
+
+    Attributs:
+        - x, y: Centre de la boîte.
+        - hw, hh: Demi-largeur et demi-hauteur.
+        - vx, vy: Vitesse, en pixels par tick.
+        """
+    __slots__ = ("vx", "vy")
+
+    def __init__(
+            self, x: float, y: float,
+            width: float, height: float,
+            vx: float = 0.0, vy: float = 0.0,
+    ):
+        """Crée une boîte centrée sur (`x`, `y`)."""
+        super().__init__(x, y, width, height)
+        self.vx = vx
+        self.vy = vy
+
+
+def _array_field(name: str, axis: int) -> property:
+    """##Propriété qui lit une case des tableaux d'un `ArrayEnemyStore`."""
+    def fget(self: BodyView) -> float:
+        return float(getattr(self.store, name)[self.index, axis])
+
+    def fset(self: BodyView, value: float) -> None:
+        getattr(self.store, name)[self.index, axis] = value
+    return property(fget, fset)
+
+
+class BodyView(Body):
+    """#Boîte d'un ennemi d'un `ArrayEnemyStore`.
+
+    Se comporte comme un `Body`, mais lit et écrit directement dans les
+    tableaux de l'ensemble.
+    """
+    __slots__ = ("store", "index")
+
+    def __init__(self, store: ArrayEnemyStore, index: int):
+        """"""
+        self.store = store
+        self.index = index
+
+    x = _array_field("pos", 0)
+    y = _array_field("pos", 1)
+    hw = _array_field("half", 0)
+    hh = _array_field("half", 1)
+    vx = _array_field("vel", 0)
+    vy = _array_field("vel", 1)
+
+
+class EnemyStore:
+    """#Ensemble des ennemis, gardés comme une liste de `Body`.
+
+    Utilisé lorsque NumPy n'est pas disponible. Voir `ArrayEnemyStore`
+    pour la version vectorisée.
+
+    Attributs:
+        - bodies: Boîtes des ennemis.
+        - grid: Grille de la phase large, ou None pour tout tester.
+    """
+    def __init__(self):
+        """"""
+        self.bodies: list[Body] = []
+        self.grid: SpatialHash | None = None
+        self._cells: list[list[int]] = []
+
+    def __len__(self) -> int:
+        return len(self.bodies)
+
+    def __getitem__(self, index: int) -> Body:
+        return self.bodies[index]
+
+    def __iter__(self) -> Iterator[Body]:
+        return (self[i] for i in range(len(self)))
+
+    def add(
+            self, x: float, y: float,
+            width: float, height: float,
+            vx: float, vy: float,
+    ) -> int:
+        """##Ajoute un ennemi centré sur (`x`, `y`).
+
+        Returns:
+            - L'indice du nouvel ennemi.
+        """
+        body = Body(x, y, width, height, vx, vy)
+        self.bodies.append(body)
+        index = len(self.bodies) - 1
+        if self.grid is not None:
+            cells = self.grid.cell_range(*body.box)
+            self.grid.add(index, cells)
+            self._cells.append(list(cells))
+        return index
+
+    def attach_grid(self, grid: SpatialHash) -> None:
+        """##Range les ennemis dans une grille pour la phase large.
+
+        La grille est ensuite tenue à jour à chaque `advance`.
+        """
+        self.grid = grid
+        self._cells = []
+        for index, body in enumerate(self.bodies):
+            cells = grid.cell_range(*body.box)
+            grid.add(index, cells)
+            self._cells.append(list(cells))
+
+    def advance(self, width: float, height: float) -> None:
+        """##Déplace les ennemis et les fait rebondir sur les murs.
+
+        Args:
+            - width: Largeur de l'arène.
+            - height: Hauteur de l'arène.
+        """
+        for body in self.bodies:
+            body.x += body.vx
+            body.y += body.vy
+            # Si l'objet touche à un mur, il change de direction.
+            if body.x - body.hw <= 0 or body.x + body.hw >= width:
+                body.vx = -body.vx
+            if body.y - body.hh <= 0 or body.y + body.hh >= height:
+                body.vy = -body.vy
+        if self.grid is not None:
+            self._update_grid()
+
+    def place(self, states: list[tuple[float, float, float, float]]) -> None:
+        """##Remplace les positions et vitesses de tous les ennemis.
+
+        Args:
+            - states: Un tuple (x, y, vx, vy) par ennemi, dans l'ordre.
+        """
+        for body, (x, y, vx, vy) in zip(self.bodies, states):
+            body.x, body.y, body.vx, body.vy = x, y, vx, vy
+        if self.grid is not None:
+            self._update_grid()
+
+    def _update_grid(self) -> None:
+        """##Déplace dans la grille les ennemis qui ont changé de cellule."""
+        grid, cells = self.grid, self._cells
+        size = grid.cell_size
+        for index, body in enumerate(self.bodies):
+            x, y, hw, hh = body.x, body.y, body.hw, body.hh
+            cx1, cy1 = int((x - hw) // size), int((y - hh) // size)
+            cx2, cy2 = int((x + hw) // size), int((y + hh) // size)
+            # Compare sans créer de tuple : cas courant, rien ne change
+            old = cells[index]
+            if (cx1 != old[0] or cy1 != old[1]
+                    or cx2 != old[2] or cy2 != old[3]):
+                grid.move(index, tuple(old), (cx1, cy1, cx2, cy2))
+                old[:] = cx1, cy1, cx2, cy2
+
+    def overlapping(self, body: Body) -> list[int]:
+        """##Retourne les indices des ennemis qui touchent une boîte."""
+        if self.grid is None:
+            return [
+                i for i, enemy in enumerate(self.bodies)
+                if enemy.overlaps(body)
+            ]
+        candidates = self.grid.query(self.grid.cell_range(*body.box))
+        return sorted(
+            i for i in candidates if self.bodies[i].overlaps(body)
+        )
+
+    def boxes(self) -> list[tuple[float, float, float, float]]:
+        """##Retourne les coordonnées (x1, y1, x2, y2) des ennemis."""
+        return [body.box for body in self.bodies]
+
+
+class ArrayEnemyStore(EnemyStore):
+    """#Ensemble des ennemis dans des tableaux NumPy contigus.
+
+    Les positions (centres), demi-tailles et vitesses sont des tableaux
+    de forme (N, 2). Un tick déplace tous les ennemis, inverse les
+    vitesses qui frappent un mur et teste le chevauchement avec le
+    joueur en quelques opérations vectorisées, qui écrivent dans des
+    tampons réutilisés plutôt que dans des tableaux temporaires.
+
+    Attributs:
+        - pos: Centres des ennemis.
+        - half: Demi-largeurs et demi-hauteurs.
+        - vel: Vitesses, en pixels par tick.
+        - cells: Cellules de la grille couvertes par chaque ennemi.
+        """
+    _COLUMNS = {
+        "pos": (2, "f8"), "half": (2, "f8"), "vel": (2, "f8"),
+        "cells": (4, "i8"),
+        # Tampons réutilisés à chaque tick
+        "_lo": (2, "f8"), "_hi": (2, "f8"),
+        "_hit": (2, "?"), "_wall": (2, "?"),
+        "_new": (4, "i8"), "_diff": (4, "?"),
+    }
+    """Nombre de colonnes et type de chaque tableau."""
+
+    def __init__(self, capacity: int = 16):
+        """"""
+        self._count = 0
+        self.grid = None
+        self._limit = np.zeros(2)
+        self._center = np.zeros(2)
+        self._reach = np.zeros(2)
+        self._buffers: dict[str, np.ndarray] = {}
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        """##Crée les tableaux avec une capacité donnée, en gardant les
+        données existantes."""
+        for name, (columns, dtype) in self._COLUMNS.items():
+            buffer = np.zeros((capacity, columns), dtype)
+            if name in self._buffers:
+                buffer[:self._count] = self._buffers[name][:self._count]
+            self._buffers[name] = buffer
+        self._slice()
+
+    def _slice(self) -> None:
+        """##Garde des vues sur les lignes utilisées de chaque tableau."""
+        for name, buffer in self._buffers.items():
+            setattr(self, name, buffer[:self._count])
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> BodyView:
+        if not -self._count <= index < self._count:
+            raise IndexError("enemy index out of range")
+        return BodyView(self, index % self._count)
+
+    def add(
+            self, x: float, y: float,
+            width: float, height: float,
+            vx: float, vy: float,
+    ) -> int:
+        if self._count == len(self._buffers["pos"]):
+            # Double la capacité afin que l'ajout reste O(1) amorti
+            self._allocate(2 * self._count)
+        index = self._count
+        self._buffers["pos"][index] = x, y
+        self._buffers["half"][index] = width / 2, height / 2
+        self._buffers["vel"][index] = vx, vy
+        self._count += 1
+        self._slice()
+        if self.grid is not None:
+            cells = self.grid.cell_range(*self[index].box)
+            self.grid.add(index, cells)
+            self.cells[index] = cells
+        return index
+
+    def attach_grid(self, grid: SpatialHash) -> None:
+        self.grid = grid
+        self.cells[...] = self._cell_ranges()
+        for index, row in enumerate(self.cells.tolist()):
+            grid.add(index, tuple(row))
+
+    def _cell_ranges(self) -> np.ndarray:
+        """##Calcule les cellules couvertes par chaque ennemi.
+
+        Returns:
+            - Un tampon de forme (N, 4), écrasé au prochain appel.
+        """
+        lo, hi, size = self._lo, self._hi, self.grid.cell_size
+        np.subtract(self.pos, self.half, out=lo)
+        np.add(self.pos, self.half, out=hi)
+        np.floor_divide(lo, size, out=lo)
+        np.floor_divide(hi, size, out=hi)
+        new = self._new
+        new[:, :2] = lo
+        new[:, 2:] = hi
+        return new
+
+    def advance(self, width: float, height: float) -> None:
+        pos, half, vel = self.pos, self.half, self.vel
+        lo, hi, hit, wall = self._lo, self._hi, self._hit, self._wall
+        pos += vel
+        # Si l'objet touche à un mur, il change de direction.
+        np.subtract(pos, half, out=lo)
+        np.add(pos, half, out=hi)
+        self._limit[0], self._limit[1] = width, height
+        np.less_equal(lo, 0.0, out=hit)
+        np.greater_equal(hi, self._limit, out=wall)
+        hit |= wall
+        np.negative(vel, out=vel, where=hit)
+        if self.grid is not None:
+            self._update_grid()
+
+    def place(self, states: list[tuple[float, float, float, float]]) -> None:
+        if not states:
+            return
+        array = np.array(states, dtype=float)
+        self.pos[...] = array[:, :2]
+        self.vel[...] = array[:, 2:]
+        if self.grid is not None:
+            self._update_grid()
+
+    def _update_grid(self) -> None:
+        new, old, diff = self._cell_ranges(), self.cells, self._diff
+        np.not_equal(new, old, out=diff)
+        if not diff.any():
+            return
+        # Seuls les ennemis qui changent de cellule touchent à la grille
+        for index in np.flatnonzero(diff.any(axis=1)).tolist():
+            self.grid.move(
+                index, tuple(old[index].tolist()), tuple(new[index].tolist())
+            )
+        old[...] = new
+
+    def overlapping(self, body: Body) -> list[int]:
+        pos, half = self.pos, self.half
+        lo, hi, hit = self._lo, self._hi, self._hit
+        index = None
+        if self.grid is not None:
+            candidates = self.grid.query(self.grid.cell_range(*body.box))
+            if not candidates:
+                return []
+            index = np.fromiter(candidates, np.intp, len(candidates))
+            index.sort()
+            count = len(index)
+            lo, hi, hit = lo[:count], hi[:count], hit[:count]
+            pos = np.take(self.pos, index, axis=0, out=lo, mode="clip")
+            half = np.take(self.half, index, axis=0, out=hi, mode="clip")
+        self._center[0], self._center[1] = body.x, body.y
+        self._reach[0], self._reach[1] = body.hw, body.hh
+        np.subtract(pos, self._center, out=lo)
+        np.abs(lo, out=lo)
+        np.add(half, self._reach, out=hi)
+        np.less_equal(lo, hi, out=hit)
+        near = hit[:, 0]
+        np.logical_and(near, hit[:, 1], out=near)
+        hits = np.flatnonzero(near)
+        return (hits if index is None else index[hits]).tolist()
+
+    def boxes(self) -> list[tuple[float, float, float, float]]:
+        pos, half = self.pos, self.half
+        return list(map(tuple, np.hstack((pos - half, pos + half)).tolist()))
+
+
+def make_store() -> EnemyStore:
+    """##Retourne l'ensemble d'ennemis le plus rapide disponible."""
+    return ArrayEnemyStore() if np is not None else EnemyStore()
+
+
+class World:
+    """#État complet d'une partie, sans affichage.
+
+    Attributs:
+        - width: Largeur de l'arène.
+        - height: Hauteur de l'arène.
+        - border: Épaisseur de la bordure mortelle pour le joueur.
+        - player: Boîte du joueur.
+        - enemies: Ensemble des ennemis (voir `make_store`).
+        - ticks: Nombre de ticks simulés.
+        - collision_time: Durée de la dernière vérification de
+          collision par `step`, en secondes.
+
+    Notes:
+        - Avec `cell_size`, les collisions passent par une grille
+          uniforme dont les cellules ont ce côté. Une valeur nulle ou
+          None teste tous les ennemis.
+        - Les ennemis rebondissent sur les bords de l'arène, alors que
+          le joueur meurt en touchant la bordure.
+        """
+    def __init__(
+            self, width: float, height: float,
+            border: float = 0,
+            cell_size: float | None = None,
+            store: EnemyStore | None = None,
+    ):
+        """"""
+        self.width = width
+        self.height = height
+        self.border = border
+        self.player = Body(width / 2, height / 2, 0, 0)
+        self.enemies = store if store is not None else make_store()
+        if cell_size:
+            self.enemies.attach_grid(SpatialHash(cell_size))
+        self.ticks = 0
+        self.collision_time = 0.0
+
+    @classmethod
+    def from_config(
+            cls, config: Config,
+            width: float, height: float,
+            store: EnemyStore | None = None,
+    ) -> World:
+        """##Crée une partie à partir de la configuration.
+
+        Args:
+            - config: Configuration du jeu.
+            - width: Largeur de l'arène.
+            - height: Hauteur de l'arène.
+            - store: Ensemble d'ennemis vide à utiliser. Par défaut,
+              celui de `make_store`.
+
+        Returns:
+            - Une partie avec le joueur au centre de l'arène.
+        """
+        world = cls(
+            width, height,
+            config["Game"]["Size"]["Border"],
+            config["Game"]["Collision"]["CellSize"],
+            store,
+        )
+        size = config["Player"]["Size"]
+        world.player = Body(
+            width / 2, height / 2, size["Width"], size["Height"]
+        )
+        for enemy in config["Enemies"]:
+            pos = enemy["Position"]
+            speed = enemy["Speed"]
+            size = enemy["Size"]
+            world.enemies.add(
+                pos["X"], pos["Y"],
+                size["Width"], size["Height"],
+                speed["X"], speed["Y"],
+            )
+        return world
+
+    @classmethod
+    def from_settings(
+            cls, settings: Settings,
+            width: float, height: float,
+            store: EnemyStore | None = None,
+    ) -> World:
+        """##Crée une partie à partir de paramètres figés.
+
+        Équivalent à `from_config`, sans parcourir de dictionnaires.
+
+        Args:
+            - settings: Paramètres de la partie (voir `settings.snapshot`).
+            - width: Largeur de l'arène.
+            - height: Hauteur de l'arène.
+            - store: Ensemble d'ennemis vide à utiliser. Par défaut,
+              celui de `make_store`.
+
+        Returns:
+            - Une partie avec le joueur au centre de l'arène.
+        """
+        world = cls(
+            width, height,
+            settings.game.border, settings.game.cell_size,
+            store,
+        )
+        player = settings.player
+        world.player = Body(width / 2, height / 2, player.width, player.height)
+        add = world.enemies.add
+        for enemy in settings.enemies:
+            add(
+                enemy.x, enemy.y, enemy.width, enemy.height,
+                enemy.speed_x, enemy.speed_y,
+            )
+        return world
+
+    def resize(self, width: float, height: float) -> None:
+        """##Change les dimensions de l'arène."""
+        self.width = width
+        self.height = height
+
+    def set_speeds(self, speeds: Iterable[tuple[float, float]]) -> None:
+        """##Change la vitesse des ennemis en gardant leur direction.
+
+        Seule la grandeur de chaque composante est prise dans `speeds` :
+        un ennemi qui revient d'un mur ne repart pas vers celui-ci.
+
+        Args:
+            - speeds: Vitesses (x, y), dans l'ordre de `enemies`. Les
+              ennemis en trop gardent leur vitesse.
+        """
+        for body, (vx, vy) in zip(self.enemies, speeds):
+            body.vx = copysign(vx, body.vx) if body.vx else vx
+            body.vy = copysign(vy, body.vy) if body.vy else vy
+
+    def step(self) -> bool:
+        """##Avance la partie d'un tick.
+
+        Returns:
+            - True si un ennemi touche le joueur, False sinon.
+        """
+        self.advance()
+        start = perf_counter()
+        collided = self.collision()
+        self.collision_time = perf_counter() - start
+        return collided
+
+    def advance(self) -> None:
+        """##Déplace les ennemis et les fait rebondir sur les murs."""
+        self.enemies.advance(self.width, self.height)
+        self.ticks += 1
+
+    def collision(self) -> bool:
+        """##Vérifie si un ennemi touche le joueur."""
+        return bool(self.enemies.overlapping(self.player))
+
+    def player_hits_wall(self, border: float | None = None) -> bool:
+        """##Vérifie si le joueur touche la bordure.
+
+        Args:
+            - border: Épaisseur de la bordure. Par défaut, celle de la
+              partie.
+        """
+        if border is None:
+            border = self.border
+        return not self.player.inside(
+            border, border, self.width - border, self.height - border
+        )
+
+    def move_player(self, x: float, y: float) -> bool:
+        """##Centre le joueur sur (`x`, `y`).
+
+        Le déplacement est refusé si le joueur touche déjà la bordure.
+
+        Returns:
+            - True si le joueur a été déplacé, False s'il touche un mur.
+        """
+        if self.player_hits_wall():
+            return False
+        self.player.moveto(x, y)
+        return True
+
+    def drag_player(self, x: float, y: float, steps: int = 1) -> bool:
+        """##Déplace le joueur vers (`x`, `y`) en `steps` étapes égales.
+
+        Chaque étape passe par `move_player`. Avec plusieurs étapes, un
+        déplacement rapide qui entre dans la bordure est donc détecté
+        dès ce déplacement, et le joueur s'arrête à la première étape
+        qui la touche.
+
+        Returns:
+            - False dès qu'une étape est refusée, True sinon.
+        """
+        x0, y0 = self.player.x, self.player.y
+        for step in range(1, steps):
+            t = step / steps
+            if not self.move_player(x0 + (x - x0) * t, y0 + (y - y0) * t):
+                return False
+        return self.move_player(x, y)
+
+
+def test_headless_bounce():
+    world = World(100, 100)
+    world.player = Body(90, 90, 4, 4)
+    world.enemies.add(10, 50, 10, 10, -6, 0)
+
+    # L'ennemi sort du mur gauche au premier tick, puis rebondit.
+    assert not world.step()
+    assert world.enemies[0].vx == 6
+    world.step()
+    assert world.enemies[0].box[0] == 5
+
+    assert world.move_player(20, 50)
+    assert world.step()
+
+
+def test_drag_player():
+    world = World(100, 100, border=10)
+    world.player = Body(50, 50, 4, 4)
+
+    # En une étape, l'entrée dans la bordure n'est vue qu'au suivant.
+    assert world.drag_player(95, 50)
+    assert not world.drag_player(50, 50)
+
+    world.player = Body(50, 50, 4, 4)
+    assert not world.drag_player(95, 50, steps=8)
+    assert world.player.x < 95
+
+
+def test_stores_agree():
+    if np is None:
+        return
+    stores = (
+        EnemyStore(), ArrayEnemyStore(capacity=1),
+        EnemyStore(), ArrayEnemyStore(capacity=1),
+    )
+    stores[2].attach_grid(SpatialHash(16))
+    stores[3].attach_grid(SpatialHash(16))
+    for store in stores:
+        for i in range(50):
+            store.add(7 * i % 90 + 5, 3 * i % 90 + 5, 8, 6, i % 7 - 3, 2.5)
+        for _ in range(500):
+            store.advance(100, 80)
+    for store in stores[1:]:
+        assert store.boxes() == stores[0].boxes()
+    player = Body(50, 40, 10, 10)
+    hits = stores[0].overlapping(player)
+    assert hits
+    for store in stores[1:]:
+        assert store.overlapping(player) == hits
+
+
+def test_set_speeds():
+    world = World(100, 100)
+    world.enemies.add(50, 50, 10, 10, -2, 3)
+    world.enemies.add(20, 20, 10, 10, 0, 1)
+    world.set_speeds([(5, 4)])
+    assert (world.enemies[0].vx, world.enemies[0].vy) == (-5, 4)
+    assert (world.enemies[1].vx, world.enemies[1].vy) == (0, 1)
+    world.set_speeds([(5, 4), (6, 7)])
+    assert (world.enemies[1].vx, world.enemies[1].vy) == (6, 7)
+
+
+def test_from_settings():
+    from config import Config
+    from settings import Settings
+
+    config = Config.get_instance("defaults")
+    settings = Settings.from_config(config)
+    a = World.from_config(config, 300, 200)
+    b = World.from_settings(settings, 300, 200)
+    assert a.enemies.boxes() == b.enemies.boxes()
+    assert (a.player.box, a.border) == (b.player.box, b.border)
+
+
+if __name__ == "__main__":
+    test_headless_bounce()
+    test_drag_player()
+    test_stores_agree()
+    test_set_speeds()
+    test_from_settings()
+    print("All test passed")